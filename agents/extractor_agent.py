@@ -1,14 +1,21 @@
 import sys
-from crewai import Agent, Task
+from typing import TYPE_CHECKING
 from utils.pdf_parser import parse_generic_pdf, merge_all_companies
 from agents.shared_state import shared_state
 from utils.event_logger import event_logger
 from utils.live_logger import live_logger
 import glob
 import json
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
 
-def create_extractor_agent() -> Agent:
+# crewai is only needed to build the CrewAI objects; run_pipeline never imports it
+if TYPE_CHECKING:
+    from crewai import Agent, Task
+
+def create_extractor_agent() -> "Agent":
+    from crewai import Agent
     return Agent(
         role="Data Collector",
         goal="Extract company names and conference attendees from PDFs",
@@ -17,6 +24,12 @@ def create_extractor_agent() -> Agent:
         allow_delegation=False,
     )
 
+# PDF parsing is CPU-bound and stateless per file, so several PDFs are parsed in
+# worker processes; each pool lives for one run, which also releases PyMuPDF's heap.
+# Workers are spawned, never forked: this runs on a thread of the (multithreaded)
+# Streamlit server, and a forked child could inherit locks held by other threads.
+MAX_PARSE_WORKERS = os.cpu_count() or 1
+
 def extract_companies_from_pdfs(input_dir: str = "data/input") -> dict:
     print("🔍 Agent 1: Starting extraction...")
     sys.stdout.flush()
@@ -35,34 +48,45 @@ def extract_companies_from_pdfs(input_dir: str = "data/input") -> dict:
                     {"files": [os.path.basename(p) for p in pdf_files]})
 
     all_rows = []
-    for pdf_path in pdf_files:
-        if live_logger.is_cancelled():
-            print("\n⚠️ Cancelled")
-            sys.stdout.flush()
-            live_logger.log("INFO", "agent1", "CANCELLED", f"Stopped at {len(all_rows)} rows")
-            return {"companies": [], "stats": {"total": 0}}
-
-        print(f"\n  → Parsing: {os.path.basename(pdf_path)}")
-        sys.stdout.flush()
-        live_logger.log("INFO", "agent1", "PARSING_PDF", f"Processing {os.path.basename(pdf_path)}")
-
-        try:
-            rows = parse_generic_pdf(pdf_path)
-            unique = len({(r.get("company") or "").lower().strip() for r in rows if r.get("company")})
-            speakers = len([r for r in rows if r.get("role") == "speaker" and r.get("contact_name")])
-            attendees = len([r for r in rows if r.get("role") == "attendee"])
-
-            print(f"    ✓ {len(rows)} rows ({unique} companies, {speakers} speakers, {attendees} attendees)")
-            sys.stdout.flush()
-            live_logger.log("INFO", "agent1", "PDF_PARSED",
-                          f"{os.path.basename(pdf_path)}: {len(rows)} rows, {unique} companies",
-                          {"rows": len(rows), "companies": unique, "speakers": speakers, "attendees": attendees})
-
-            all_rows.extend(rows)
-        except Exception as e:
-            print(f"    ⚠ Error: {e}")
+    failed = 0
+    pool = None
+    if len(pdf_files) > 1:
+        pool = ProcessPoolExecutor(max_workers=min(MAX_PARSE_WORKERS, len(pdf_files)),
+                                   mp_context=multiprocessing.get_context("spawn"))
+        pending = [pool.submit(parse_generic_pdf, pdf_path) for pdf_path in pdf_files]
+    try:
+        for i, pdf_path in enumerate(pdf_files):
+            if live_logger.is_cancelled():
+                print("\n⚠️ Cancelled")
+                sys.stdout.flush()
+                live_logger.log("INFO", "agent1", "CANCELLED", f"Stopped at {len(all_rows)} rows")
+                return {"companies": [], "stats": {"total": 0}}
+
+            print(f"\n  → Parsing: {os.path.basename(pdf_path)}")
             sys.stdout.flush()
-            live_logger.log("ERROR", "agent1", "PDF_ERROR", str(e))
+            live_logger.log("INFO", "agent1", "PARSING_PDF", f"Processing {os.path.basename(pdf_path)}")
+
+            try:
+                rows = pending[i].result() if pool else parse_generic_pdf(pdf_path)
+                unique = len({(r.get("company") or "").lower().strip() for r in rows if r.get("company")})
+                speakers = len([r for r in rows if r.get("role") == "speaker" and r.get("contact_name")])
+                attendees = len([r for r in rows if r.get("role") == "attendee"])
+
+                print(f"    ✓ {len(rows)} rows ({unique} companies, {speakers} speakers, {attendees} attendees)")
+                sys.stdout.flush()
+                live_logger.log("INFO", "agent1", "PDF_PARSED",
+                              f"{os.path.basename(pdf_path)}: {len(rows)} rows, {unique} companies",
+                              {"rows": len(rows), "companies": unique, "speakers": speakers, "attendees": attendees})
+
+                all_rows.extend(rows)
+            except Exception as e:
+                failed += 1
+                print(f"    ⚠ Error: {e}")
+                sys.stdout.flush()
+                live_logger.log("ERROR", "agent1", "PDF_ERROR", str(e))
+    finally:
+        if pool:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     print("\n  → Merging companies...")
     sys.stdout.flush()
@@ -81,6 +105,8 @@ def extract_companies_from_pdfs(input_dir: str = "data/input") -> dict:
     print(f"    • Contacts: {contacts}")
     print(f"    • High confidence: {high_conf}")
     print(f"    • Flagged: {flagged}")
+    if failed:
+        print(f"    • Failed PDFs: {failed}")
     sys.stdout.flush()
 
     shared_state.update("extraction", {
@@ -89,6 +115,7 @@ def extract_companies_from_pdfs(input_dir: str = "data/input") -> dict:
         "high_confidence": high_conf,
         "flagged": flagged,
         "contacts": contacts,
+        "failed_pdfs": failed,
     })
 
     event_logger.log("agent1", "system", "EXTRACTION_COMPLETE",
@@ -114,10 +141,12 @@ def extract_companies_from_pdfs(input_dir: str = "data/input") -> dict:
             "speakers": len(speakers),
             "attendees": len(attendees),
             "contacts": contacts,
+            "failed_pdfs": failed,
         },
     }
 
-def create_extraction_task(agent: Agent) -> Task:
+def create_extraction_task(agent: "Agent") -> "Task":
+    from crewai import Task
     return Task(
         description="Extract companies and attendee info from PDFs in data/input/",
         agent=agent,
@@ -68,3 +68,7 @@ class SharedState:
 
 # Global shared state instance
 shared_state = SharedState()
+
+def get_shared_state() -> SharedState:
+    """Accessor for the process-wide shared state"""
+    return shared_state
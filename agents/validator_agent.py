@@ -1,6 +1,6 @@
 import sys
 import re
-from crewai import Agent, Task
+from typing import TYPE_CHECKING
 from anthropic import Anthropic
 from config.icp_criteria import ICP_CRITERIA, SCORING_WEIGHTS
 from config.model_config import get_current_model
@@ -15,10 +15,19 @@ from dotenv import load_dotenv
 from tqdm import tqdm
 import time
 import requests
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 
 load_dotenv()
 
-def create_validator_agent() -> Agent:
+# Type hints only; the factories below import crewai when they are called
+if TYPE_CHECKING:
+    from crewai import Agent, Task
+
+VALIDATION_WORKERS = 4  # companies researched and scored concurrently
+
+def create_validator_agent() -> "Agent":
+    from crewai import Agent
     return Agent(
         role='ICP Analyst',
         goal='Validate and score each company against Ascendo.AI ideal customer profile',
@@ -331,13 +340,10 @@ def validate_companies(input_file: str = 'data/output/raw_companies.json', model
         return {'error': 'ANTHROPIC_API_KEY not set'}
 
     client = Anthropic(api_key=api_key)
-    validated_companies = []
 
-    for idx, company in enumerate(tqdm(companies, desc="  Validating"), 1):
+    def validate_one(idx, company):
         if live_logger.is_cancelled():
-            print("\n⚠️ Cancelled")
-            sys.stdout.flush()
-            break
+            return None
 
         company_name = company['company']
         print(f"\n  [{idx}/{len(companies)}] {company_name}")
@@ -346,24 +352,40 @@ def validate_companies(input_file: str = 'data/output/raw_companies.json', model
 
         research_data = research_company(company_name, client, model)
         if live_logger.is_cancelled():
-            break
+            return None
         time.sleep(0.3)
 
         validation_data = validate_icp(company, research_data, client, model)
         if live_logger.is_cancelled():
-            break
+            return None
         time.sleep(0.3)
 
-        print(f"    → Score: {validation_data.get('icp_score', 0)}/100 | Fit: {validation_data.get('fit_level', 'Unknown')}")
+        print(f"    → {company_name}: {validation_data.get('icp_score', 0)}/100 | Fit: {validation_data.get('fit_level', 'Unknown')}")
         sys.stdout.flush()
         live_logger.log("INFO", "agent2", "COMPANY_SCORED", f"{company_name}: {validation_data.get('icp_score', 0)}/100")
 
-        validated = {
+        return {
             **company, **research_data, **validation_data,
             'reasoning_text': ' | '.join(validation_data.get('reasoning', [])),
             'talking_points_text': ' | '.join(validation_data.get('talking_points', []))
         }
-        validated_companies.append(validated)
+
+    # Each company is two network-bound API calls, so several are kept in flight at once;
+    # map() keeps results in input order
+    # Workers run in a copy of this context so per-run settings (research/scoring mode) carry over
+    parent_context = contextvars.copy_context()
+
+    def run_in_context(idx, company):
+        return parent_context.copy().run(validate_one, idx, company)
+
+    with ThreadPoolExecutor(max_workers=VALIDATION_WORKERS, thread_name_prefix="validate") as ex:
+        results = list(tqdm(ex.map(run_in_context, range(1, len(companies) + 1), companies),
+                            total=len(companies), desc="  Validating"))
+    validated_companies = [v for v in results if v is not None]
+
+    if live_logger.is_cancelled():
+        print("\n⚠️ Cancelled")
+        sys.stdout.flush()
 
     shared_state.update('validation', {
         'status': 'complete',
@@ -384,6 +406,18 @@ def validate_companies(input_file: str = 'data/output/raw_companies.json', model
 
     df.to_csv('data/output/validated_companies.csv', index=False)
 
+    # Binary copy for the summary readers; they prefer it, so a failed write must not leave an old one behind
+    parquet_path = 'data/output/validated_companies.parquet'
+    # Model output can mix types in one column (employee_count: 5000 or "500-1000"); store those
+    # as text, which is also how they come back from the CSV
+    mixed = [c for c in df.columns if df[c].dtype == object and df[c].dropna().map(type).nunique() > 1]
+    try:
+        df.astype({c: 'string' for c in mixed}).to_parquet(parquet_path, index=False)
+    except Exception as e:
+        print(f"  ⚠ Parquet copy skipped: {e}")
+        if os.path.exists(parquet_path):
+            os.remove(parquet_path)
+
     print(f"\n✅ Agent 2: Complete → {len(validated_companies)} validated")
     sys.stdout.flush()
 
@@ -395,7 +429,8 @@ def validate_companies(input_file: str = 'data/output/raw_companies.json', model
 
     return {'validated_companies': validated_companies, 'stats': {'total': len(validated_companies), 'high': high, 'med': med, 'low': low}}
 
-def create_validation_task(agent: Agent, extraction_task: Task) -> Task:
+def create_validation_task(agent: "Agent", extraction_task: "Task") -> "Task":
+    from crewai import Task
     return Task(
         description="Validate companies against ICP, score 0-100, generate insights.",
         agent=agent,
@@ -1,51 +1,159 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import os
 import sys
 import time
-import json
-import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import warnings
-import glob
 from datetime import datetime
 
+# pyarrow is optional; without it the CSV copies are read instead of the Parquet ones
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
 from crew_setup import run_pipeline
-from agents.shared_state import shared_state
-from utils.live_logger import live_logger
+from agents.shared_state import get_shared_state
+from utils.live_logger import get_live_logger
+from utils import json_io
 from config.model_config import (
     get_available_models, save_model_config, load_model_config,
     get_model_display_name, DEFAULT_MODEL
 )
-from config.research_config import get_research_mode, set_research_mode, COST_ESTIMATES, get_scoring_mode, set_scoring_mode
+from config.research_config import (
+    get_research_mode, set_research_mode, COST_ESTIMATES, get_scoring_mode, set_scoring_mode, run_modes
+)
+
+@st.cache_resource
+def _init_process():
+    """Process-wide setup; reruns re-execute this module, so guard via the resource cache"""
+    warnings.filterwarnings('ignore', message='.*ScriptRunContext.*')
+
+_init_process()
 
-warnings.filterwarnings('ignore', message='.*ScriptRunContext.*')
+# One instance across all sessions and reruns; the pipeline modules log to the same objects
+live_logger = st.cache_resource(get_live_logger)()
+shared_state = st.cache_resource(get_shared_state)()
 
 SAVED_ANALYSES_DIR = "data/saved_analyses"
+SAVED_INDEX = os.path.join(SAVED_ANALYSES_DIR, "index.jsonl")
+RESULTS_CSV = "data/output/validated_companies.csv"
+RESULTS_PARQUET = "data/output/validated_companies.parquet"
+RESULTS_DTYPES = {'fit_level': 'category', 'industry': 'category',
+                  'recommended_action': 'category', 'contact_title': 'category'}
+OVERVIEW_COLS = ('company', 'industry', 'employee_count', 'icp_score', 'fit_level', 'recommended_action')
+REASONING_COLS = ('company', 'icp_score', 'reasoning_text', 'talking_points_text')
+LOG_VIEW_ROWS = 2000  # tail of the live log shown in the grid
+
+_RESEARCH_OPTIONS = ("training_data", "web_search_anthropic", "web_search_brave")
+_RESEARCH_INDEX = {m: i for i, m in enumerate(_RESEARCH_OPTIONS)}
+_MODE_DISPLAY = {
+    "training_data": "Training Data",
+    "web_search_anthropic": "Anthropic Web Search",
+    "web_search_brave": "Brave Search API"
+}
+
+_SCORING_OPTIONS = ("ai_scored", "ai_direct")
+_SCORING_INDEX = {m: i for i, m in enumerate(_SCORING_OPTIONS)}
+_SCORING_DISPLAY = {
+    "ai_scored": "AI Sub-Scores (Programmatic)",
+    "ai_direct": "AI Direct (Overall Judgement)"
+}
+_SCORING_HELP = {
+    "ai_scored": "Claude scores each metric (industry 0-35, size 0-25, etc.) and we sum them",
+    "ai_direct": "Claude decides the final score (0-100) directly"
+}
+
+def list_files(directory, ext):
+    """(path, mtime) for files in directory ending with ext; one scandir pass, [] if missing"""
+    try:
+        with os.scandir(directory) as it:
+            return [(e.path, e.stat().st_mtime) for e in it if e.name.endswith(ext) and e.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+def _load_meta(path):
+    try:
+        meta = json_io.load_file(path)
+        meta['file_path'] = path
+        return meta
+    except:
+        return None
+
+def _read_index():
+    with open(SAVED_INDEX, 'rb') as f:
+        return [json_io.loads(line) for line in f if line.strip()]
+
+def _scan_saved_meta():
+    """Metadata from the per-analysis JSON files (saves made before the index existed)"""
+    paths = [path for path, _ in list_files(SAVED_ANALYSES_DIR, '.json')]
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(16, len(paths))) as ex:
+        return [meta for meta in ex.map(_load_meta, paths) if meta is not None]
+
+def _has_saved_data(meta):
+    return any(meta.get(key) and os.path.exists(meta[key]) for key in ('parquet_path', 'csv_path'))
+
+def _write_index(analyses):
+    tmp_path = f"{SAVED_INDEX}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.writelines(json_io.dumps(meta) + b"\n" for meta in analyses)
+    os.replace(tmp_path, SAVED_INDEX)
+
+def _update_index(meta):
+    """Add a new analysis to index.jsonl, building it if missing and pruning deleted analyses"""
+    try:
+        analyses = _read_index()
+    except FileNotFoundError:
+        _write_index([m for m in _scan_saved_meta() if _has_saved_data(m)])  # includes meta's JSON
+        return
+    present = [m for m in analyses if _has_saved_data(m)]
+    if len(present) == len(analyses):
+        with open(SAVED_INDEX, 'ab') as f:
+            f.write(json_io.dumps(meta) + b"\n")
+    else:
+        _write_index(present + [meta])
+
+@st.cache_data(show_spinner=False)
+def _list_saved(dir_mtime_ns):
+    """Read saved analysis metadata; dir_mtime_ns is only the cache key. Never writes:
+    save_analysis maintains the index, so entries whose files were deleted are skipped here."""
+    try:
+        analyses = _read_index()
+    except FileNotFoundError:
+        analyses = _scan_saved_meta()
+    present = [meta for meta in analyses if _has_saved_data(meta)]
+    return sorted(present, key=lambda x: x.get('timestamp', ''), reverse=True)
 
 def get_saved_analyses():
     """Get list of saved analysis files"""
-    if not os.path.exists(SAVED_ANALYSES_DIR):
+    try:
+        dir_mtime_ns = os.stat(SAVED_ANALYSES_DIR).st_mtime_ns
+    except FileNotFoundError:
         return []
-    files = glob.glob(os.path.join(SAVED_ANALYSES_DIR, '*.json'))
-    analyses = []
-    for f in files:
-        try:
-            with open(f, 'r', encoding='utf-8') as fp:
-                meta = json.load(fp)
-                meta['file_path'] = f
-                analyses.append(meta)
-        except:
-            pass
-    return sorted(analyses, key=lambda x: x.get('timestamp', ''), reverse=True)
+    return _list_saved(dir_mtime_ns)
 
 def save_analysis(df, config):
     """Save analysis results with metadata"""
     os.makedirs(SAVED_ANALYSES_DIR, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    base_path = os.path.join(SAVED_ANALYSES_DIR, f"analysis_{timestamp}")
 
-    csv_path = os.path.join(SAVED_ANALYSES_DIR, f"analysis_{timestamp}.csv")
+    csv_path = base_path + ".csv"
     df.to_csv(csv_path, index=False)
 
+    # Parquet is what load_analysis reads back; the CSV stays for people opening the folder
+    parquet_path = base_path + ".parquet"
+    try:
+        df.to_parquet(parquet_path, index=False, compression='zstd')
+    except Exception as e:
+        print(f"Parquet save skipped: {e}")
+        parquet_path = None
+
     meta = {
         'timestamp': timestamp,
         'display_name': datetime.now().strftime("%Y-%m-%d %H:%M"),
@@ -54,20 +162,66 @@ def save_analysis(df, config):
         'model': config.get('model', 'unknown'),
         'research_mode': config.get('research_mode', 'unknown'),
         'scoring_mode': config.get('scoring_mode', 'unknown'),
-        'csv_path': csv_path
+        'csv_path': csv_path,
+        'parquet_path': parquet_path
     }
 
-    meta_path = os.path.join(SAVED_ANALYSES_DIR, f"analysis_{timestamp}.json")
-    with open(meta_path, 'w', encoding='utf-8') as f:
-        json.dump(meta, f, indent=2)
+    meta_path = base_path + ".json"
+    json_io.dump_file(meta_path, meta, indent=True)
+
+    _update_index({**meta, 'file_path': meta_path})
 
     return meta_path
 
-def load_analysis(meta):
+@st.cache_resource
+def _executor():
+    """Single long-lived pipeline worker shared across reruns and clicks"""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="pipeline")
+
+@st.cache_resource
+def _pipeline_job():
+    """Holds the future of the last submitted run, shared like the executor itself"""
+    return {'future': None}
+
+def _previous_run_active():
+    """A cancelled run keeps the worker until it notices the flag; clear() would reset that flag"""
+    future = _pipeline_job()['future']
+    return future is not None and not future.done()
+
+@st.cache_data(show_spinner=False)
+def _read_results_cached(path, mtime, size, columns):
+    if path.endswith('.parquet'):
+        if columns:
+            available = set(pq.read_schema(path).names)
+            columns = [c for c in columns if c in available]
+        return pd.read_parquet(path, columns=columns)
+    if not columns:
+        return pd.read_csv(path, dtype=RESULTS_DTYPES)
+    df = pd.read_csv(path, dtype=RESULTS_DTYPES, usecols=lambda c: c in columns)
+    return df[[c for c in columns if c in df.columns]]
+
+def read_results(path, columns=None):
+    """Read a results CSV or Parquet file, re-parsing only when the file changes.
+
+    columns narrows the read to those columns (missing ones are ignored); None reads everything.
+    """
+    stat = os.stat(path)
+    return _read_results_cached(path, stat.st_mtime, stat.st_size,
+                                tuple(columns) if columns else None)
+
+def analysis_path(meta):
+    """Saved file to read for an analysis, preferring the Parquet copy"""
+    for key in ('parquet_path', 'csv_path') if pq is not None else ('csv_path',):
+        path = meta.get(key)
+        if path and os.path.exists(path):
+            return path
+    return None
+
+def load_analysis(meta, columns=None):
     """Load analysis from saved file"""
-    csv_path = meta.get('csv_path')
-    if csv_path and os.path.exists(csv_path):
-        return pd.read_csv(csv_path)
+    path = analysis_path(meta)
+    if path:
+        return read_results(path, columns)
     return None
 
 st.set_page_config(page_title="ICP Validator", layout="wide")
@@ -110,10 +264,8 @@ with st.sidebar:
         if selected_analysis > 0:
             if st.button("Load Selected"):
                 meta = saved_analyses[selected_analysis - 1]
-                df = load_analysis(meta)
-                if df is not None:
+                if analysis_path(meta):
                     st.session_state.loaded_analysis = {
-                        'df': df,
                         'meta': meta
                     }
                     st.session_state.completed = True
@@ -127,7 +279,7 @@ with st.sidebar:
     st.markdown("---")
     st.markdown("### Input PDFs")
     input_dir = st.text_input("Input Directory", value="data/input")
-    pdf_files = glob.glob(os.path.join(input_dir, '*.pdf')) if os.path.exists(input_dir) else []
+    pdf_files = [path for path, _ in list_files(input_dir, '.pdf')]
 
     if not pdf_files:
         st.error(f"No PDFs found in {input_dir}")
@@ -144,12 +296,15 @@ with st.sidebar:
         if st.button("Refresh", help="Refresh models"):
             st.session_state.force_refresh = True
 
-    available_models = get_available_models(force_refresh=st.session_state.get('force_refresh', False))
-    if st.session_state.get('force_refresh'):
-        st.session_state.force_refresh = False
-        st.rerun()
+    if 'available_models' not in st.session_state or st.session_state.get('force_refresh'):
+        st.session_state.available_models = get_available_models(
+            force_refresh=st.session_state.get('force_refresh', False))
+    st.session_state.force_refresh = False
+    available_models = st.session_state.available_models
 
-    current_model = load_model_config()
+    if 'current_model' not in st.session_state:
+        st.session_state.current_model = load_model_config()
+    current_model = st.session_state.current_model
     model_options = {}
     default_index = 0
 
@@ -169,6 +324,7 @@ with st.sidebar:
 
     if selected_model != current_model:
         save_model_config(selected_model)
+        st.session_state.current_model = selected_model
 
     st.markdown("---")
     st.markdown("### Validation Settings")
@@ -198,17 +354,11 @@ with st.sidebar:
     st.markdown("### Research Mode")
     current_research_mode = get_research_mode()
 
-    mode_display = {
-        "training_data": "Training Data",
-        "web_search_anthropic": "Anthropic Web Search",
-        "web_search_brave": "Brave Search API"
-    }
-
     research_mode = st.radio(
         "Research Method",
-        options=["training_data", "web_search_anthropic", "web_search_brave"],
-        format_func=lambda x: mode_display[x],
-        index=["training_data", "web_search_anthropic", "web_search_brave"].index(current_research_mode)
+        options=_RESEARCH_OPTIONS,
+        format_func=_MODE_DISPLAY.__getitem__,
+        index=_RESEARCH_INDEX[current_research_mode]
     )
 
     if research_mode == "web_search_brave":
@@ -221,32 +371,28 @@ with st.sidebar:
     st.markdown("### Scoring Mode")
     current_scoring_mode = get_scoring_mode()
 
-    scoring_display = {
-        "ai_scored": "AI Sub-Scores (Programmatic)",
-        "ai_direct": "AI Direct (Overall Judgement)"
-    }
-    scoring_help = {
-        "ai_scored": "Claude scores each metric (industry 0-35, size 0-25, etc.) and we sum them",
-        "ai_direct": "Claude decides the final score (0-100) directly"
-    }
-
     scoring_mode = st.radio(
         "Scoring Method",
-        options=["ai_scored", "ai_direct"],
-        format_func=lambda x: scoring_display[x],
-        index=["ai_scored", "ai_direct"].index(current_scoring_mode)
+        options=_SCORING_OPTIONS,
+        format_func=_SCORING_DISPLAY.__getitem__,
+        index=_SCORING_INDEX[current_scoring_mode]
     )
-    st.caption(scoring_help[scoring_mode])
+    st.caption(_SCORING_HELP[scoring_mode])
 
     if scoring_mode != current_scoring_mode:
         set_scoring_mode(scoring_mode)
 
     st.markdown("---")
 
-    can_run = len(pdf_files) > 0 and api_key and not st.session_state.running
+    stopping = not st.session_state.running and _previous_run_active()
+    can_run = len(pdf_files) > 0 and api_key and not st.session_state.running and not stopping
+
+    if stopping:
+        st.caption("Previous run is still finishing...")
 
     if st.button("Run Analysis", type="primary", disabled=not can_run):
         live_logger.clear()
+        st.session_state.pop('log_rows', None)
         st.session_state.running = True
         st.session_state.completed = False
         st.session_state.thread_started = False
@@ -266,7 +412,7 @@ with st.sidebar:
         sys.stdout.flush()
         st.rerun()
 
-    if st.button("Reset"):
+    if st.button("Reset", disabled=stopping):
         live_logger.clear()
         st.session_state.running = False
         st.session_state.completed = False
@@ -281,12 +427,9 @@ with st.sidebar:
             st.session_state.completed = True
             st.warning("Stopping...")
 
-if st.session_state.running:
-    st.header("Pipeline Progress")
-    max_comp = st.session_state.get('run_max_companies', 50)
-    comp_text = "all companies" if max_comp is None else f"{max_comp} companies"
-    st.caption(f"Settings: {comp_text} | {get_research_mode()} mode")
-
+@st.fragment(run_every=0.5)
+def render_progress():
+    """Live progress panel; re-runs on its own timer without re-running the sidebar"""
     progress_bar = st.progress(0)
     status_text = st.empty()
 
@@ -303,67 +446,47 @@ if st.session_state.running:
 
     st.header("Live Activity Log")
     log_stats = st.empty()
-    log_container = st.container(height=400)
-
-    if not st.session_state.thread_started and live_logger.start_pipeline():
-        st.session_state.thread_started = True
+    log_container = st.container()
 
-        run_input_dir = st.session_state.get('run_input_dir', 'data/input')
-        run_model = st.session_state.get('run_model', None)
-        run_min_confidence = st.session_state.get('run_min_confidence', 0.7)
-        run_max_companies = st.session_state.get('run_max_companies', 50)
-
-        def run_pipeline_thread(input_dir, model, min_conf, max_comp):
-            try:
-                print(f"\n[THREAD] Starting pipeline thread")
-                print(f"[THREAD] input_dir={input_dir}")
-                print(f"[THREAD] model={model}")
-                print(f"[THREAD] min_confidence={min_conf}")
-                print(f"[THREAD] max_companies={max_comp}")
-                sys.stdout.flush()
-
-                result = run_pipeline(input_dir, model, min_conf, max_comp)
-                live_logger.set_completed(result=result)
-                print(f"\n[THREAD] Pipeline completed successfully")
-                sys.stdout.flush()
-            except Exception as e:
-                print(f"\n[THREAD] Pipeline error: {e}")
-                sys.stdout.flush()
-                live_logger.set_completed(error=str(e))
-
-        thread = threading.Thread(
-            target=run_pipeline_thread,
-            args=(run_input_dir, run_model, run_min_confidence, run_max_companies),
-            daemon=True
-        )
-        thread.start()
-    elif live_logger.is_pipeline_running():
-        pass
-
-    logs = live_logger.get_formatted_logs()
-    all_logs = live_logger.get_logs()
     stats = live_logger.get_stats()
 
+    # Only entries logged since the last tick are formatted; the grid rows are kept across ticks
+    # A clear() from any session bumps the logger generation, which restarts this session's rows
+    if 'log_rows' not in st.session_state:
+        st.session_state.log_generation = None
+    generation, new_logs = live_logger.get_logs_since(st.session_state.log_generation,
+                                                      st.session_state.get('log_cursor', 0))
+    if generation != st.session_state.log_generation:
+        st.session_state.log_rows = deque(maxlen=LOG_VIEW_ROWS)
+        st.session_state.log_cursor = 0
+        st.session_state.log_generation = generation
+    st.session_state.log_cursor += len(new_logs)
+    st.session_state.log_rows.extend(
+        (l['timestamp'].strftime("%H:%M:%S"), l['agent'].upper(), l['action'], l['details'])
+        for l in new_logs
+    )
+
     with log_container:
-        if logs:
-            st.code(logs, language="log")
+        if st.session_state.log_rows:
+            df_logs = pd.DataFrame(list(st.session_state.log_rows), columns=['time', 'agent', 'action', 'details'])
+            st.dataframe(df_logs, height=400, use_container_width=True, hide_index=True)
         else:
             st.text("Waiting for logs...")
 
     log_stats.caption(f"**Events:** {stats['total_events']} | **API Calls:** {stats['api_calls']} | **Duration:** {stats['duration']:.1f}s")
 
-    agent1_logs = [l for l in all_logs if l['agent'] == 'agent1']
-    agent2_logs = [l for l in all_logs if l['agent'] == 'agent2']
+    last1 = live_logger.get_last('agent1')
+    last2 = live_logger.get_last('agent2')
 
-    if agent1_logs:
-        last = agent1_logs[-1]
+    if last1:
+        last = last1
         if 'COMPLETE' in last['action'] or 'Complete' in last['action']:
             extraction_status.success("Agent 1: Complete")
         else:
             extraction_status.info(f"Agent 1: {last['action']}")
 
-    if agent2_logs:
-        last = agent2_logs[-1]
+    if last2:
+        last = last2
         if 'VALIDATING' in last['action']:
             validation_status.info(f"{last['details'].split(':')[0] if ':' in last['details'] else last['action']}")
         elif 'COMPLETE' in last['action'] or 'Complete' in last['action']:
@@ -371,12 +494,12 @@ if st.session_state.running:
         else:
             validation_status.info(f"Agent 2: {last['action']}")
 
-    if agent2_logs:
+    if last2:
         status_text.text("Phase 2/2: ICP Validation")
-        progress_bar.progress(min(50 + len(agent2_logs), 95))
-    elif agent1_logs:
+        progress_bar.progress(min(50 + live_logger.get_count('agent2'), 95))
+    elif last1:
         status_text.text("Phase 1/2: PDF Extraction")
-        progress_bar.progress(min(10 + len(agent1_logs) * 5, 50))
+        progress_bar.progress(min(10 + live_logger.get_count('agent1') * 5, 50))
     else:
         status_text.text("Starting...")
         progress_bar.progress(5)
@@ -399,105 +522,150 @@ if st.session_state.running:
         st.session_state.end_time = time.time()
         time.sleep(0.5)
         st.rerun()
-    else:
-        time.sleep(0.5)
-        st.rerun()
+
+if st.session_state.running:
+    st.header("Pipeline Progress")
+    max_comp = st.session_state.get('run_max_companies', 50)
+    comp_text = "all companies" if max_comp is None else f"{max_comp} companies"
+    st.caption(f"Settings: {comp_text} | {get_research_mode()} mode")
+
+    if not st.session_state.thread_started and not _previous_run_active() and live_logger.start_pipeline():
+        st.session_state.thread_started = True
+
+        run_input_dir = st.session_state.get('run_input_dir', 'data/input')
+        run_model = st.session_state.get('run_model', None)
+        run_min_confidence = st.session_state.get('run_min_confidence', 0.7)
+        run_max_companies = st.session_state.get('run_max_companies', 50)
+        run_research_mode = st.session_state.get('run_research_mode', get_research_mode())
+        run_scoring_mode = st.session_state.get('run_scoring_mode', get_scoring_mode())
+
+        def run_pipeline_thread(input_dir, model, min_conf, max_comp, research_mode, scoring_mode):
+            try:
+                print(f"\n[THREAD] Starting pipeline thread")
+                print(f"[THREAD] input_dir={input_dir}")
+                print(f"[THREAD] model={model}")
+                print(f"[THREAD] min_confidence={min_conf}")
+                print(f"[THREAD] max_companies={max_comp}")
+                sys.stdout.flush()
+
+                with run_modes(research_mode, scoring_mode):
+                    result = run_pipeline(input_dir, model, min_conf, max_comp)
+                live_logger.set_completed(result=result)
+                print(f"\n[THREAD] Pipeline completed successfully")
+                sys.stdout.flush()
+            except Exception as e:
+                print(f"\n[THREAD] Pipeline error: {e}")
+                sys.stdout.flush()
+                live_logger.set_completed(error=str(e))
+
+        _pipeline_job()['future'] = _executor().submit(run_pipeline_thread, run_input_dir, run_model,
+                                                       run_min_confidence, run_max_companies, run_research_mode, run_scoring_mode)
+
+    render_progress()
 
 elif st.session_state.completed:
     st.header("Results Summary")
 
-    df = None
-    loaded_meta = None
-
     if st.session_state.loaded_analysis:
-        df = st.session_state.loaded_analysis['df']
         loaded_meta = st.session_state.loaded_analysis['meta']
         st.info(f"Loaded: {loaded_meta['display_name']} | Model: {loaded_meta.get('model', 'N/A')} | Mode: {loaded_meta.get('research_mode', 'N/A')}")
-    elif os.path.exists('data/output/validated_companies.csv'):
-        df = pd.read_csv('data/output/validated_companies.csv')
-
-    if df is not None:
-        col1, col2, col3, col4 = st.columns(4)
-        high = len(df[df['icp_score'] >= 70])
-        med = len(df[(df['icp_score'] >= 45) & (df['icp_score'] < 70)])
-        low = len(df[df['icp_score'] < 45])
-        with col1:
-            st.metric("Total", len(df))
-        with col2:
-            st.metric("High Fit (70+)", f"{high} ({high*100//len(df)}%)")
-        with col3:
-            st.metric("Medium (45-69)", f"{med} ({med*100//len(df)}%)")
-        with col4:
-            st.metric("Low (<45)", f"{low} ({low*100//len(df)}%)")
-
-        st.header("Distribution")
-        col1, col2 = st.columns(2)
-        with col1:
-            st.bar_chart(df['fit_level'].value_counts())
-        with col2:
-            bins = pd.cut(df['icp_score'], bins=[0, 25, 50, 75, 100], labels=['0-25', '26-50', '51-75', '76-100'])
-            st.bar_chart(bins.value_counts().sort_index())
-
-        st.header("Top 10 Priority")
-        top10_cols = ['company', 'industry', 'employee_count', 'icp_score', 'fit_level', 'recommended_action']
-        top10_cols = [c for c in top10_cols if c in df.columns]
-        st.dataframe(df.nlargest(10, 'icp_score')[top10_cols], hide_index=True)
-
-        if 'industry' in df.columns:
-            st.header("Industries")
-            st.bar_chart(df['industry'].value_counts().head(10))
-
-        st.header("Full Results")
-
-        view_mode = st.radio("View", ["Summary", "Detailed", "All Columns"], horizontal=True)
-
-        if view_mode == "Summary":
-            display_cols = ['company', 'industry', 'icp_score', 'fit_level', 'recommended_action']
-        elif view_mode == "Detailed":
-            display_cols = ['company', 'contact_name', 'contact_title', 'industry', 'employee_count',
-                          'has_field_service', 'field_service_scale', 'icp_score', 'fit_level',
-                          'recommended_action', 'confidence']
-        else:
-            display_cols = df.columns.tolist()
-
-        display_cols = [c for c in display_cols if c in df.columns]
-        st.dataframe(df[display_cols], hide_index=True, use_container_width=True)
-
-        with st.expander("Reasoning & Talking Points"):
-            for idx, row in df.nlargest(5, 'icp_score').iterrows():
-                st.markdown(f"**{row['company']}** (Score: {row['icp_score']})")
-                if 'reasoning_text' in row:
-                    st.markdown(f"*Reasoning:* {row['reasoning_text'][:500]}...")
-                if 'talking_points_text' in row:
-                    st.markdown(f"*Talking Points:* {row['talking_points_text'][:500]}...")
-                st.markdown("---")
-
-        st.header("Export")
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.download_button("Download CSV", df.to_csv(index=False), "validated_companies.csv", "text/csv")
-        with col2:
-            if not st.session_state.loaded_analysis:
-                if st.button("Save Analysis"):
-                    config = {
-                        'model': st.session_state.get('run_model', 'unknown'),
-                        'research_mode': st.session_state.get('run_research_mode', 'unknown'),
-                        'scoring_mode': st.session_state.get('run_scoring_mode', 'unknown')
-                    }
-                    save_analysis(df, config)
-                    st.success("Analysis saved!")
-                    st.rerun()
-        with col3:
-            log_file, _ = live_logger.save_to_file()
-            if os.path.exists(log_file):
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    st.download_button("Download Logs", f.read(), os.path.basename(log_file), "text/plain")
-
-        if 'start_time' in st.session_state and 'end_time' in st.session_state and not st.session_state.loaded_analysis:
-            duration = st.session_state.end_time - st.session_state.start_time
-            st.info(f"Time: {duration:.1f}s")
+        results_path = analysis_path(loaded_meta)
+        csv_path = loaded_meta.get('csv_path')
     else:
+        csv_path = RESULTS_CSV
+        results_path = RESULTS_PARQUET if pq is not None and os.path.exists(RESULTS_PARQUET) else RESULTS_CSV
+    if not results_path or not os.path.exists(results_path):
         st.error("Results not found")
+        st.stop()
+
+    # Each section reads only the columns it shows; reads are cached per column set
+    df = read_results(results_path, OVERVIEW_COLS)
+
+    col1, col2, col3, col4 = st.columns(4)
+    fit_bins = pd.cut(df['icp_score'], bins=[-np.inf, 45, 70, np.inf],
+                      labels=['Low', 'Medium', 'High'], right=False)
+    fit_counts = fit_bins.value_counts()
+    high, med, low = int(fit_counts['High']), int(fit_counts['Medium']), int(fit_counts['Low'])
+    with col1:
+        st.metric("Total", len(df))
+    with col2:
+        st.metric("High Fit (70+)", f"{high} ({high*100//len(df)}%)")
+    with col3:
+        st.metric("Medium (45-69)", f"{med} ({med*100//len(df)}%)")
+    with col4:
+        st.metric("Low (<45)", f"{low} ({low*100//len(df)}%)")
+
+    st.header("Distribution")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.bar_chart(df['fit_level'].value_counts())
+    with col2:
+        bins = pd.cut(df['icp_score'], bins=[0, 25, 50, 75, 100], labels=['0-25', '26-50', '51-75', '76-100'])
+        st.bar_chart(bins.value_counts().sort_index())
+
+    st.header("Top 10 Priority")
+    top10_cols = ['company', 'industry', 'employee_count', 'icp_score', 'fit_level', 'recommended_action']
+    top10_cols = [c for c in top10_cols if c in df.columns]
+    top10 = df.nlargest(10, 'icp_score')
+    st.dataframe(top10[top10_cols], hide_index=True)
+
+    if 'industry' in df.columns:
+        st.header("Industries")
+        st.bar_chart(df['industry'].value_counts().head(10))
+
+    st.header("Full Results")
+
+    view_mode = st.radio("View", ["Summary", "Detailed", "All Columns"], horizontal=True)
+
+    if view_mode == "Summary":
+        display_cols = ['company', 'industry', 'icp_score', 'fit_level', 'recommended_action']
+    elif view_mode == "Detailed":
+        display_cols = ['company', 'contact_name', 'contact_title', 'industry', 'employee_count',
+                      'has_field_service', 'field_service_scale', 'icp_score', 'fit_level',
+                      'recommended_action', 'confidence']
+    else:
+        display_cols = None
+
+    df_view = read_results(results_path, display_cols)
+    st.dataframe(df_view, hide_index=True, use_container_width=True)
+
+    with st.expander("Reasoning & Talking Points"):
+        # Both reads come from the same file, so top10's row labels address the same companies
+        df_reasoning = read_results(results_path, REASONING_COLS)
+        for idx, row in df_reasoning.loc[top10.index[:5]].iterrows():
+            st.markdown(f"**{row['company']}** (Score: {row['icp_score']})")
+            if 'reasoning_text' in row:
+                st.markdown(f"*Reasoning:* {row['reasoning_text'][:500]}...")
+            if 'talking_points_text' in row:
+                st.markdown(f"*Talking Points:* {row['talking_points_text'][:500]}...")
+            st.markdown("---")
+
+    st.header("Export")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if csv_path and os.path.exists(csv_path):
+            with open(csv_path, 'rb') as f:
+                st.download_button("Download CSV", f.read(), "validated_companies.csv", "text/csv")
+    with col2:
+        if not st.session_state.loaded_analysis:
+            if st.button("Save Analysis"):
+                config = {
+                    'model': st.session_state.get('run_model', 'unknown'),
+                    'research_mode': st.session_state.get('run_research_mode', 'unknown'),
+                    'scoring_mode': st.session_state.get('run_scoring_mode', 'unknown')
+                }
+                save_analysis(read_results(results_path), config)
+                st.success("Analysis saved!")
+                st.rerun()
+    with col3:
+        log_file, _ = live_logger.save_to_file()
+        if os.path.exists(log_file):
+            with open(log_file, 'r', encoding='utf-8') as f:
+                st.download_button("Download Logs", f.read(), os.path.basename(log_file), "text/plain")
+
+    if 'start_time' in st.session_state and 'end_time' in st.session_state and not st.session_state.loaded_analysis:
+        duration = st.session_state.end_time - st.session_state.start_time
+        st.info(f"Time: {duration:.1f}s")
 
 else:
     st.info("""
@@ -5,7 +5,19 @@ in industries with complex, mission-critical products that create heavy technica
 and field service demand.
 """
 
-ICP_CRITERIA = {
+import re
+from types import MappingProxyType
+
+def _freeze(value):
+    """Read-only view of nested config: dicts become mappingproxies, lists become tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+ICP_CRITERIA = _freeze({
     "target_industries": {
         "primary": [
             "Telecom & Optical Networking",
@@ -99,9 +111,9 @@ ICP_CRITERIA = {
             "Agent assist and coaching"
         ]
     }
-}
+})
 
-SCORING_WEIGHTS = {
+SCORING_WEIGHTS = _freeze({
     "industry_match": {
         "primary_exact": 35,
         "adjacent": 20,
@@ -136,7 +148,11 @@ SCORING_WEIGHTS = {
         "consumer_focused": -20,
         "no_field_service": -15
     }
-}
+})
+
+# (factor, level) -> points, so the per-company scorer does one lookup per weight
+_WEIGHT = {(factor, level): points
+           for factor, levels in SCORING_WEIGHTS.items() for level, points in levels.items()}
 
 PRIMARY_INDUSTRIES = [
     "telecom", "optical", "networking", "data platform", "infrastructure",
@@ -168,23 +184,33 @@ RELEVANT_TITLES = [
 ]
 
 
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Compile a keyword list into a single substring alternation"""
+    return re.compile("|".join(re.escape(k) for k in keywords))
+
+_PRIMARY_RE = _keyword_pattern(PRIMARY_INDUSTRIES)
+_ADJACENT_RE = _keyword_pattern(ADJACENT_INDUSTRIES)
+_FSM_RE = _keyword_pattern(FSM_CRM_PLATFORMS)
+_PERFECT_RE = _keyword_pattern(PERFECT_TITLES)
+_RELEVANT_RE = _keyword_pattern(RELEVANT_TITLES)
+
+_EMPLOYEE_NOISE_RE = re.compile(r"[,+]|approximately|about")
+_RANGE_RE = re.compile(r"^(\d+)\s*-\s*(\d+)\s*(?:-|$)")
+_DIGITS_RE = re.compile(r"\d+")
+
+
 def parse_employee_count(employee_str) -> int:
     if not employee_str or employee_str == "unknown":
         return 0
-    employee_str = str(employee_str).lower().replace(",", "").replace("+", "")
-    employee_str = employee_str.replace("approximately", "").replace("about", "").strip()
-
-    if "-" in employee_str:
-        parts = employee_str.split("-")
-        try:
-            return (int(parts[0].strip()) + int(parts[1].strip())) // 2
-        except:
-            pass
-
-    import re
-    numbers = re.findall(r'\d+', employee_str)
-    if numbers:
-        return int(numbers[0])
+    employee_str = _EMPLOYEE_NOISE_RE.sub("", str(employee_str).lower()).strip()
+
+    m = _RANGE_RE.match(employee_str)
+    if m:
+        return (int(m.group(1)) + int(m.group(2))) // 2
+
+    m = _DIGITS_RE.search(employee_str)
+    if m:
+        return int(m.group(0))
     return 0
 
 
@@ -193,78 +219,78 @@ def calculate_icp_score(research_data: dict, company_data: dict) -> dict:
     breakdown = {}
 
     industry = (research_data.get("industry") or "").lower()
-    is_primary = any(ind in industry for ind in PRIMARY_INDUSTRIES)
-    is_adjacent = any(ind in industry for ind in ADJACENT_INDUSTRIES)
+    is_primary = bool(_PRIMARY_RE.search(industry))
+    is_adjacent = bool(_ADJACENT_RE.search(industry))
 
     if is_primary:
-        score += SCORING_WEIGHTS["industry_match"]["primary_exact"]
-        breakdown["industry"] = f"+{SCORING_WEIGHTS['industry_match']['primary_exact']} (primary: {research_data.get('industry', 'unknown')})"
+        score += _WEIGHT["industry_match", "primary_exact"]
+        breakdown["industry"] = f"+{_WEIGHT['industry_match', 'primary_exact']} (primary: {research_data.get('industry', 'unknown')})"
     elif is_adjacent:
-        score += SCORING_WEIGHTS["industry_match"]["adjacent"]
-        breakdown["industry"] = f"+{SCORING_WEIGHTS['industry_match']['adjacent']} (adjacent: {research_data.get('industry', 'unknown')})"
+        score += _WEIGHT["industry_match", "adjacent"]
+        breakdown["industry"] = f"+{_WEIGHT['industry_match', 'adjacent']} (adjacent: {research_data.get('industry', 'unknown')})"
     else:
         breakdown["industry"] = f"+0 (unrelated: {research_data.get('industry', 'unknown')})"
 
     employee_count = parse_employee_count(research_data.get("employee_count"))
     if employee_count >= 2000:
-        score += SCORING_WEIGHTS["company_size"]["enterprise"]
-        breakdown["size"] = f"+{SCORING_WEIGHTS['company_size']['enterprise']} (enterprise: {employee_count}+)"
+        score += _WEIGHT["company_size", "enterprise"]
+        breakdown["size"] = f"+{_WEIGHT['company_size', 'enterprise']} (enterprise: {employee_count}+)"
     elif employee_count >= 500:
-        score += SCORING_WEIGHTS["company_size"]["mid_market"]
-        breakdown["size"] = f"+{SCORING_WEIGHTS['company_size']['mid_market']} (mid-market: {employee_count})"
+        score += _WEIGHT["company_size", "mid_market"]
+        breakdown["size"] = f"+{_WEIGHT['company_size', 'mid_market']} (mid-market: {employee_count})"
     else:
-        score += SCORING_WEIGHTS["company_size"]["small"]
-        breakdown["size"] = f"+{SCORING_WEIGHTS['company_size']['small']} (small: {employee_count})"
+        score += _WEIGHT["company_size", "small"]
+        breakdown["size"] = f"+{_WEIGHT['company_size', 'small']} (small: {employee_count})"
 
     tech_stack = research_data.get("tech_stack", [])
     if isinstance(tech_stack, str):
         tech_stack = [tech_stack]
     tech_str = " ".join(tech_stack).lower() if tech_stack else ""
 
-    has_fsm = any(platform in tech_str for platform in FSM_CRM_PLATFORMS)
+    has_fsm = bool(_FSM_RE.search(tech_str))
     if has_fsm:
-        score += SCORING_WEIGHTS["tech_stack"]["has_fsm_crm"]
-        breakdown["tech_stack"] = f"+{SCORING_WEIGHTS['tech_stack']['has_fsm_crm']} (FSM/CRM: {', '.join(tech_stack[:3])})"
+        score += _WEIGHT["tech_stack", "has_fsm_crm"]
+        breakdown["tech_stack"] = f"+{_WEIGHT['tech_stack', 'has_fsm_crm']} (FSM/CRM: {', '.join(tech_stack[:3])})"
     elif tech_stack and len(tech_stack) > 0:
-        score += SCORING_WEIGHTS["tech_stack"]["has_basic_crm"]
-        breakdown["tech_stack"] = f"+{SCORING_WEIGHTS['tech_stack']['has_basic_crm']} (basic tech)"
+        score += _WEIGHT["tech_stack", "has_basic_crm"]
+        breakdown["tech_stack"] = f"+{_WEIGHT['tech_stack', 'has_basic_crm']} (basic tech)"
     else:
         breakdown["tech_stack"] = "+0 (no tech identified)"
 
     operations = (research_data.get("support_operations") or "").lower()
     if "global" in operations or "worldwide" in operations or "international" in operations:
-        score += SCORING_WEIGHTS["support_operations"]["global_multi_language"]
-        breakdown["operations"] = f"+{SCORING_WEIGHTS['support_operations']['global_multi_language']} (global)"
+        score += _WEIGHT["support_operations", "global_multi_language"]
+        breakdown["operations"] = f"+{_WEIGHT['support_operations', 'global_multi_language']} (global)"
     elif "regional" in operations or "multi" in operations:
-        score += SCORING_WEIGHTS["support_operations"]["regional"]
-        breakdown["operations"] = f"+{SCORING_WEIGHTS['support_operations']['regional']} (regional)"
+        score += _WEIGHT["support_operations", "regional"]
+        breakdown["operations"] = f"+{_WEIGHT['support_operations', 'regional']} (regional)"
     else:
-        score += SCORING_WEIGHTS["support_operations"]["local_only"]
-        breakdown["operations"] = f"+{SCORING_WEIGHTS['support_operations']['local_only']} (local/unknown)"
+        score += _WEIGHT["support_operations", "local_only"]
+        breakdown["operations"] = f"+{_WEIGHT['support_operations', 'local_only']} (local/unknown)"
 
     contact_title = (company_data.get("contact_title") or "").lower()
-    is_perfect = any(title in contact_title for title in PERFECT_TITLES)
-    is_relevant = any(title in contact_title for title in RELEVANT_TITLES)
+    is_perfect = bool(_PERFECT_RE.search(contact_title))
+    is_relevant = bool(_RELEVANT_RE.search(contact_title))
 
     if is_perfect:
-        score += SCORING_WEIGHTS["buyer_persona_match"]["perfect_title"]
-        breakdown["persona"] = f"+{SCORING_WEIGHTS['buyer_persona_match']['perfect_title']} (perfect: {company_data.get('contact_title', 'unknown')})"
+        score += _WEIGHT["buyer_persona_match", "perfect_title"]
+        breakdown["persona"] = f"+{_WEIGHT['buyer_persona_match', 'perfect_title']} (perfect: {company_data.get('contact_title', 'unknown')})"
     elif is_relevant:
-        score += SCORING_WEIGHTS["buyer_persona_match"]["relevant_title"]
-        breakdown["persona"] = f"+{SCORING_WEIGHTS['buyer_persona_match']['relevant_title']} (relevant title)"
+        score += _WEIGHT["buyer_persona_match", "relevant_title"]
+        breakdown["persona"] = f"+{_WEIGHT['buyer_persona_match', 'relevant_title']} (relevant title)"
     else:
         breakdown["persona"] = "+0 (other title)"
 
     bonuses = []
     team_size = company_data.get("team_size", 1) or 1
     if team_size >= 5:
-        score += SCORING_WEIGHTS["bonuses"]["team_size_5plus"]
-        bonuses.append(f"team_size_5+ (+{SCORING_WEIGHTS['bonuses']['team_size_5plus']})")
+        score += _WEIGHT["bonuses", "team_size_5plus"]
+        bonuses.append(f"team_size_5+ (+{_WEIGHT['bonuses', 'team_size_5plus']})")
 
     has_field_service = research_data.get("has_field_service", False)
     if not has_field_service:
-        score += SCORING_WEIGHTS["penalties"]["no_field_service"]
-        breakdown["penalty"] = f"{SCORING_WEIGHTS['penalties']['no_field_service']} (no field service)"
+        score += _WEIGHT["penalties", "no_field_service"]
+        breakdown["penalty"] = f"{_WEIGHT['penalties', 'no_field_service']} (no field service)"
 
     if bonuses:
         breakdown["bonuses"] = ", ".join(bonuses)
@@ -2,11 +2,17 @@
 
 from anthropic import Anthropic
 import os
-import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
-from datetime import datetime, timedelta
+from datetime import datetime
+
+from utils import json_io
 
 load_dotenv()
 
@@ -17,6 +23,24 @@ DEFAULT_MODEL = "claude-3-5-sonnet-20241022"
 CONFIG_FILE = "config/model_settings.json"
 MODELS_CACHE_FILE = "config/models_cache.json"
 CACHE_DURATION_HOURS = 24  # Cache models for 24 hours
+MEMO_SECONDS = 600  # In-process reuse of the last model list before re-checking the cache file
+
+# Shared session so repeated API calls reuse the pooled keep-alive connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4, pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=["GET"])
+))
+
+_config_dir_ready = False
+
+def _ensure_config_dir():
+    """Create the config directory once per process"""
+    global _config_dir_ready
+    if not _config_dir_ready:
+        os.makedirs('config', exist_ok=True)
+        _config_dir_ready = True
 
 def fetch_models_from_api(api_key: str = None) -> Optional[List[Dict]]:
     """
@@ -30,7 +54,7 @@ def fetch_models_from_api(api_key: str = None) -> Optional[List[Dict]]:
         return None
 
     try:
-        response = requests.get(
+        response = _SESSION.get(
             'https://api.anthropic.com/v1/models',
             headers={
                 'anthropic-version': '2023-06-01',
@@ -40,7 +64,7 @@ def fetch_models_from_api(api_key: str = None) -> Optional[List[Dict]]:
         )
 
         if response.status_code == 200:
-            data = response.json()
+            data = json_io.loads(response.content)
             return data.get('data', [])
         else:
             print(f"API returned status {response.status_code}")
@@ -52,20 +76,16 @@ def fetch_models_from_api(api_key: str = None) -> Optional[List[Dict]]:
 
 def get_cached_models() -> Optional[Dict]:
     """Load models from cache if still valid"""
-    if not os.path.exists(MODELS_CACHE_FILE):
+    # Freshness comes from the file's mtime, so a stale cache is rejected without being read
+    try:
+        age = time.time() - os.stat(MODELS_CACHE_FILE).st_mtime
+    except FileNotFoundError:
+        return None
+    if age >= CACHE_DURATION_HOURS * 3600:
         return None
 
     try:
-        with open(MODELS_CACHE_FILE, 'r') as f:
-            cache = json.load(f)
-
-        # Check if cache is still valid
-        cached_time = datetime.fromisoformat(cache.get('cached_at', '2000-01-01'))
-        if datetime.now() - cached_time < timedelta(hours=CACHE_DURATION_HOURS):
-            return cache
-        else:
-            return None
-
+        return json_io.load_file(MODELS_CACHE_FILE)
     except Exception as e:
         print(f"Failed to load cache: {e}")
         return None
@@ -73,13 +93,12 @@ def get_cached_models() -> Optional[Dict]:
 def save_models_cache(models: List[Dict]):
     """Save fetched models to cache"""
     try:
-        os.makedirs('config', exist_ok=True)
+        _ensure_config_dir()
         cache = {
             'cached_at': datetime.now().isoformat(),
             'models': models
         }
-        with open(MODELS_CACHE_FILE, 'w') as f:
-            json.dump(cache, f, indent=2)
+        json_io.dump_file(MODELS_CACHE_FILE, cache)
     except Exception as e:
         print(f"Failed to save cache: {e}")
 
@@ -117,35 +136,33 @@ def get_fallback_models() -> List[Dict[str, str]]:
         }
     ]
 
+# Model name to description mapping; more specific keys first, the pattern tries them in this order
+MODEL_DESCRIPTIONS = {
+    'sonnet-4': 'Latest and most capable model',
+    'opus-4': 'Most capable Opus model',
+    'sonnet': 'Most intelligent model, best for complex tasks',
+    'opus': 'Powerful model for complex reasoning',
+    'haiku': 'Fastest model, good for simple tasks'
+}
+_DESCRIPTION_RE = re.compile("|".join(re.escape(k) for k in MODEL_DESCRIPTIONS))
+# Latest Sonnet gets marked as recommended: any Sonnet 4, or Sonnet 3.5
+_RECOMMENDED_RE = re.compile(r"sonnet-4|sonnet.*3-5|3-5.*sonnet")
+
 def enhance_model_info(models: List[Dict]) -> List[Dict[str, str]]:
     """
     Add descriptions and recommendations to API model data.
     """
-    # Model name to description mapping
-    descriptions = {
-        'sonnet-4': 'Latest and most capable model',
-        'opus-4': 'Most capable Opus model',
-        'sonnet': 'Most intelligent model, best for complex tasks',
-        'opus': 'Powerful model for complex reasoning',
-        'haiku': 'Fastest model, good for simple tasks'
-    }
-
     enhanced = []
     for model in models:
         model_id = model.get('id', '')
         display_name = model.get('display_name', model_id)
+        model_id_lower = model_id.lower()
 
         # Determine description
-        description = 'Claude model'
-        for key, desc in descriptions.items():
-            if key.lower() in model_id.lower() or key.lower() in display_name.lower():
-                description = desc
-                break
-
-        # Mark latest Sonnet as recommended
-        recommended = 'sonnet-4' in model_id.lower() or (
-            'sonnet' in model_id.lower() and '3-5' in model_id
-        )
+        m = _DESCRIPTION_RE.search(model_id_lower) or _DESCRIPTION_RE.search(display_name.lower())
+        description = MODEL_DESCRIPTIONS[m.group(0)] if m else 'Claude model'
+
+        recommended = bool(_RECOMMENDED_RE.search(model_id_lower))
 
         enhanced.append({
             'id': model_id,
@@ -156,13 +173,25 @@ def enhance_model_info(models: List[Dict]) -> List[Dict[str, str]]:
 
     return enhanced
 
+_models_memo = {}
+
 def get_available_models(force_refresh: bool = False) -> List[Dict[str, str]]:
     """
-    Get available models - tries API first, falls back to cache, then hardcoded list.
+    Get available models, reusing the in-process result for MEMO_SECONDS.
 
     Args:
-        force_refresh: If True, bypasses cache and fetches from API
+        force_refresh: If True, bypasses both caches and fetches from API
     """
+    now = time.monotonic()
+    if not force_refresh and _models_memo and now - _models_memo['at'] < MEMO_SECONDS:
+        return _models_memo['models']
+
+    models = _load_available_models(force_refresh)
+    _models_memo.update(at=now, models=models)
+    return models
+
+def _load_available_models(force_refresh: bool) -> List[Dict[str, str]]:
+    """Tries cache first, then the API, then the hardcoded list"""
     # Try cache first (unless force refresh)
     if not force_refresh:
         cached = get_cached_models()
@@ -205,6 +234,16 @@ def verify_model_works(model_id: str, api_key: str = None) -> bool:
         print(f"Model {model_id} verification failed: {e}")
         return False
 
+def verify_models(model_ids: List[str], api_key: str = None) -> Dict[str, bool]:
+    """
+    Test several model IDs, running the probes concurrently.
+    """
+    model_ids = list(model_ids)
+    if not model_ids:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(model_ids))) as ex:
+        return dict(zip(model_ids, ex.map(lambda m: verify_model_works(m, api_key), model_ids)))
+
 def get_model_display_name(model_id: str) -> str:
     """Get friendly display name for model ID"""
     models = get_available_models()
@@ -213,26 +252,44 @@ def get_model_display_name(model_id: str) -> str:
             return model.get('display_name', model.get('name', model_id))
     return model_id
 
+_config_memo = {}
+
 def save_model_config(model_id: str):
     """Save selected model to config file"""
-    os.makedirs('config', exist_ok=True)
+    _ensure_config_dir()
     config = {
         'selected_model': model_id,
         'model_name': get_model_display_name(model_id)
     }
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=2)
+    json_io.dump_file(CONFIG_FILE, config, indent=True)
+    # Refresh the memo here: a save within the mtime granularity that keeps the file size
+    # (e.g. two model ids of equal length) would otherwise leave the old model cached
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        _config_memo.pop('entry', None)
+    else:
+        _config_memo['entry'] = ((st.st_mtime_ns, st.st_size), model_id)
 
 def load_model_config() -> str:
-    """Load selected model from config file"""
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                return config.get('selected_model', DEFAULT_MODEL)
-        except:
-            return DEFAULT_MODEL
-    return DEFAULT_MODEL
+    """Load selected model from config file, re-reading it only when the file changes"""
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        return DEFAULT_MODEL
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _config_memo.get('entry')
+    if cached and cached[0] == key:
+        return cached[1]
+
+    try:
+        model = json_io.load_file(CONFIG_FILE).get('selected_model', DEFAULT_MODEL)
+    except:
+        return DEFAULT_MODEL
+    # Key and value are stored as one tuple so concurrent readers never see a mismatched pair
+    _config_memo['entry'] = (key, model)
+    return model
 
 def get_current_model() -> str:
     """Get the currently configured model"""
@@ -1,3 +1,6 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 RESEARCH_MODE = "training_data"
 SCORING_MODE = "ai_scored"  # "ai_scored" (new: sub-scores within ranges) or "ai_direct" (old: Claude decides 0-100 directly)
 
@@ -19,32 +22,54 @@ COST_ESTIMATES = {
     }
 }
 
+# Research mode -> web search backend (None means Claude's training data only)
+_WEB_SEARCH_TYPE = {
+    "training_data": None,
+    "web_search_anthropic": "anthropic",
+    "web_search_brave": "brave"
+}
+VALID_RESEARCH_MODES = frozenset(_WEB_SEARCH_TYPE)
+VALID_SCORING_MODES = frozenset(("ai_scored", "ai_direct"))
+
+# Per-run overrides; unset means the process-wide RESEARCH_MODE / SCORING_MODE chosen in the UI
+_run_research_mode = ContextVar("research_mode")
+_run_scoring_mode = ContextVar("scoring_mode")
+
 def get_research_mode():
-    return RESEARCH_MODE
+    return _run_research_mode.get(RESEARCH_MODE)
 
 def set_research_mode(mode: str):
     global RESEARCH_MODE
-    valid = ["training_data", "web_search_anthropic", "web_search_brave"]
-    if mode not in valid:
+    if mode not in VALID_RESEARCH_MODES:
         raise ValueError(f"Invalid mode: {mode}")
     RESEARCH_MODE = mode
 
 def is_web_search_enabled():
-    return RESEARCH_MODE in ["web_search_anthropic", "web_search_brave"]
+    return _WEB_SEARCH_TYPE[get_research_mode()] is not None
 
 def get_web_search_type():
-    if RESEARCH_MODE == "web_search_anthropic":
-        return "anthropic"
-    elif RESEARCH_MODE == "web_search_brave":
-        return "brave"
-    return None
+    return _WEB_SEARCH_TYPE[get_research_mode()]
 
 def get_scoring_mode():
-    return SCORING_MODE
+    return _run_scoring_mode.get(SCORING_MODE)
 
 def set_scoring_mode(mode: str):
     global SCORING_MODE
-    valid = ["ai_scored", "ai_direct"]
-    if mode not in valid:
+    if mode not in VALID_SCORING_MODES:
         raise ValueError(f"Invalid scoring mode: {mode}. Use 'ai_scored' or 'ai_direct'")
     SCORING_MODE = mode
+
+@contextmanager
+def run_modes(research_mode: str, scoring_mode: str):
+    """Pin both modes for the current context, so a pipeline run is unaffected by later UI changes"""
+    if research_mode not in VALID_RESEARCH_MODES:
+        raise ValueError(f"Invalid mode: {research_mode}")
+    if scoring_mode not in VALID_SCORING_MODES:
+        raise ValueError(f"Invalid scoring mode: {scoring_mode}. Use 'ai_scored' or 'ai_direct'")
+    research_token = _run_research_mode.set(research_mode)
+    scoring_token = _run_scoring_mode.set(scoring_mode)
+    try:
+        yield
+    finally:
+        _run_scoring_mode.reset(scoring_token)
+        _run_research_mode.reset(research_token)
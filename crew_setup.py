@@ -1,50 +1,105 @@
+import glob
+import hashlib
+import os
 import sys
-from crewai import Crew, Process
+from agents import extractor_agent
 from agents.extractor_agent import create_extractor_agent, create_extraction_task, extract_companies_from_pdfs
 from agents.validator_agent import create_validator_agent, create_validation_task, validate_companies
+from agents.shared_state import shared_state
 from utils.live_logger import live_logger
+from utils import json_io, pdf_parser
+
+RAW_COMPANIES = 'data/output/raw_companies.json'
+EXTRACTION_CACHE_GLOB = 'data/output/raw_companies.*.json'
+
+def _extraction_key(input_dir: str) -> str:
+    """Digest of the input PDFs and the extraction source; changes whenever extraction output could"""
+    h = hashlib.blake2b(digest_size=8)
+    for path in [pdf_parser.__file__, extractor_agent.__file__] + sorted(glob.glob(os.path.join(input_dir, "*.pdf"))):
+        h.update(os.path.basename(path).encode() + b"\0")
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+def _cached_extraction(cache_path: str) -> dict:
+    cached = json_io.load_file(cache_path)
+    companies = cached["companies"]
+    stats = {**cached["stats"], "cached": True}
+    json_io.dump_file(RAW_COMPANIES, {"companies": companies}, indent=True)
+    shared_state.update("extraction", {
+        "status": "complete",
+        "companies_found": stats["total"],
+        "high_confidence": stats["high_confidence"],
+        "flagged": stats["flagged"],
+        "contacts": stats["contacts"],
+        "failed_pdfs": stats["failed_pdfs"],
+        "cached": True,
+    })
+    print(f"🔍 Agent 1: PDFs unchanged, reusing {cache_path} ({len(companies)} companies)")
+    sys.stdout.flush()
+    live_logger.log("INFO", "agent1", "EXTRACTION_COMPLETE",
+                    f"Reused cached extraction of {len(companies)} companies")
+    return {"companies": companies, "stats": stats}
+
+def _store_extraction(cache_path: str, extraction_result: dict) -> None:
+    """Cache this run's extraction under its digest; older digests can never match again"""
+    for stale in glob.glob(EXTRACTION_CACHE_GLOB):
+        if os.path.normpath(stale) != os.path.normpath(cache_path):
+            os.remove(stale)
+    json_io.dump_file(cache_path, {"companies": extraction_result["companies"],
+                                   "stats": extraction_result["stats"]})
 
 def run_pipeline(input_dir: str = 'data/input', model: str = None,
                  min_confidence: float = 0.7, max_companies: int = None) -> dict:
 
-    print("=" * 60)
-    print("🚀 Starting Pipeline...")
-    print(f"  → input_dir: {input_dir}")
-    print(f"  → model: {model}")
-    print(f"  → min_confidence: {min_confidence}")
-    print(f"  → max_companies: {max_companies}")
-    print("=" * 60)
-    sys.stdout.flush()
+    print("\n".join([
+        "=" * 60,
+        "🚀 Starting Pipeline...",
+        f"  → input_dir: {input_dir}",
+        f"  → model: {model}",
+        f"  → min_confidence: {min_confidence}",
+        f"  → max_companies: {max_companies}",
+        "=" * 60,
+    ]), flush=True)
 
     live_logger.log("INFO", "system", "PIPELINE_START",
                    f"Starting pipeline with max_companies={max_companies}")
 
-    extraction_result = extract_companies_from_pdfs(input_dir)
+    # Extraction output depends only on the PDFs, so unchanged inputs reuse the previous run's result
+    cache_path = f"data/output/raw_companies.{_extraction_key(input_dir)}.json"
+    if os.path.exists(cache_path):
+        extraction_result = _cached_extraction(cache_path)
+    else:
+        extraction_result = extract_companies_from_pdfs(input_dir)
+        # A run where some PDFs failed is incomplete; caching it would replay the gap on every run
+        if (extraction_result["companies"] and not extraction_result["stats"].get("failed_pdfs")
+                and not live_logger.is_cancelled()):
+            _store_extraction(cache_path, extraction_result)
 
     if live_logger.is_cancelled():
-        print("\n⚠️ Cancelled after extraction")
-        sys.stdout.flush()
+        print("\n⚠️ Cancelled after extraction", flush=True)
         live_logger.save_to_file()
         return {'extraction': extraction_result, 'validation': {'error': 'Cancelled'}}
 
-    print("\n" + "=" * 60)
-    sys.stdout.flush()
+    print("\n" + "=" * 60, flush=True)
 
-    validation_result = validate_companies('data/output/raw_companies.json', model,
+    validation_result = validate_companies(RAW_COMPANIES, model,
                                           min_confidence, max_companies)
 
-    print("\n" + "=" * 60)
-    print("✅ Pipeline Complete!")
-    print(f"📊 Results: data/output/validated_companies.csv")
-    sys.stdout.flush()
-
     log_file, json_file = live_logger.save_to_file()
-    print(f"📋 Logs: {log_file}")
-    sys.stdout.flush()
+    print("\n".join([
+        "\n" + "=" * 60,
+        "✅ Pipeline Complete!",
+        "📊 Results: data/output/validated_companies.csv",
+        f"📋 Logs: {log_file}",
+    ]), flush=True)
 
     return {'extraction': extraction_result, 'validation': validation_result}
 
 def run_with_crewai(input_dir: str = 'data/input') -> dict:
+    from crewai import Crew, Process
+
     print("🚀 Starting Pipeline (CrewAI Mode)...")
     print("=" * 60)
     sys.stdout.flush()
@@ -1,13 +1,14 @@
 import sys
 import os
 import signal
-import glob
 import argparse
+import numpy as np
 import pandas as pd
 
 if sys.platform == 'win32':
-    sys.stdout.reconfigure(encoding='utf-8')
-    sys.stderr.reconfigure(encoding='utf-8')
+    for stream in (sys.stdout, sys.stderr):
+        if (stream.encoding or '').lower().replace('-', '') != 'utf8':
+            stream.reconfigure(encoding='utf-8')
 
 from crew_setup import run_pipeline
 from config.model_config import load_model_config, get_model_display_name
@@ -15,6 +16,25 @@ from config.research_config import set_research_mode, get_research_mode
 from utils.live_logger import live_logger
 from utils.event_logger import event_logger
 
+# Columns the summary prints; the reasoning and talking-point text is never parsed here
+SUMMARY_COLS = ('company', 'icp_score', 'fit_level', 'recommended_action', 'industry')
+
+def load_summary_frame() -> pd.DataFrame:
+    """Summary columns of the latest results, from the Parquet copy when the pipeline wrote one"""
+    parquet_path = 'data/output/validated_companies.parquet'
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        pq = None  # optional; the CSV holds the same columns
+    if pq is not None and os.path.exists(parquet_path):
+        available = set(pq.read_schema(parquet_path).names)
+        return pd.read_parquet(parquet_path, columns=[c for c in SUMMARY_COLS if c in available])
+    try:
+        return pd.read_csv('data/output/validated_companies.csv', usecols=lambda c: c in SUMMARY_COLS,
+                           dtype={'industry': 'category', 'fit_level': 'category'})
+    except pd.errors.EmptyDataError:
+        return pd.DataFrame()
+
 def signal_handler(sig, frame):
     print("\n\n⚠️ Interrupt received. Stopping...")
     live_logger.cancel()
@@ -35,15 +55,19 @@ def main():
         set_research_mode(args.research_mode)
 
     input_dir = 'data/input'
-    pdf_files = glob.glob(os.path.join(input_dir, '*.pdf'))
+    try:
+        with os.scandir(input_dir) as it:
+            pdf_names = [e.name for e in it if e.name.endswith('.pdf') and e.is_file()]
+    except FileNotFoundError:
+        pdf_names = []
 
-    if not pdf_files:
+    if not pdf_names:
         print("[X] No PDFs in data/input/")
         sys.exit(1)
 
-    print(f"[OK] Found {len(pdf_files)} PDF(s)")
-    for pdf in pdf_files:
-        print(f"  - {os.path.basename(pdf)}")
+    print(f"[OK] Found {len(pdf_names)} PDF(s)")
+    for name in pdf_names:
+        print(f"  - {name}")
 
     current_model = load_model_config()
     print(f"[OK] Model: {get_model_display_name(current_model)}")
@@ -66,30 +90,38 @@ def main():
     print("📈 SUMMARY")
     print("=" * 60)
 
-    if os.path.exists('data/output/validated_companies.csv'):
-        df = pd.read_csv('data/output/validated_companies.csv')
-        print(f"\n📊 Statistics:")
-        print(f"  • Total: {len(df)}")
-        print(f"  • High (75+): {len(df[df['icp_score'] >= 75])}")
-        print(f"  • Medium (50-74): {len(df[(df['icp_score'] >= 50) & (df['icp_score'] < 75)])}")
-        print(f"  • Low (<50): {len(df[df['icp_score'] < 50])}")
-
-        print(f"\n🎯 Top 10:")
-        print("-" * 60)
-        top10 = df.nlargest(10, 'icp_score')[['company', 'icp_score', 'fit_level', 'recommended_action']]
-        print(top10.to_string(index=False))
-
-        print(f"\n💬 Agent Summary:")
-        event_logger.print_summary()
-
-        if 'industry' in df.columns:
-            print(f"\n🏭 Industries:")
-            for industry, count in df['industry'].value_counts().head(10).items():
-                print(f"  • {industry}: {count}")
-
-        print(f"\n✅ Results: data/output/validated_companies.csv")
-    else:
+    if not os.path.exists('data/output/validated_companies.csv'):
         print("  ❌ No results generated")
+        return
+
+    df = load_summary_frame()
+    if df.empty or 'icp_score' not in df.columns:
+        print("  ❌ No validated companies in data/output/validated_companies.csv")
+        return
+
+    print(f"\n📊 Statistics:")
+    print(f"  • Total: {len(df)}")
+    scores = df['icp_score']
+    tiers = pd.cut(scores, bins=[-np.inf, 50, 75, np.inf],
+                   labels=['Low', 'Medium', 'High'], right=False).value_counts()
+    print(f"  • High (75+): {tiers['High']}")
+    print(f"  • Medium (50-74): {tiers['Medium']}")
+    print(f"  • Low (<50): {tiers['Low']}")
+
+    print(f"\n🎯 Top 10:")
+    print("-" * 60)
+    top10 = df.loc[scores.nlargest(10).index, ['company', 'icp_score', 'fit_level', 'recommended_action']]
+    print(top10.to_string(index=False))
+
+    print(f"\n💬 Agent Summary:")
+    event_logger.print_summary()
+
+    if 'industry' in df.columns:
+        print(f"\n🏭 Industries:")
+        for industry, count in df['industry'].value_counts().head(10).items():
+            print(f"  • {industry}: {count}")
+
+    print(f"\n✅ Results: data/output/validated_companies.csv")
 
 if __name__ == "__main__":
     main()
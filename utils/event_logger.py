@@ -1,6 +1,8 @@
 """Event Logger for tracking agent communication"""
 
+import sys
 from datetime import datetime
+from itertools import islice
 from typing import List, Dict
 
 class EventLogger:
@@ -8,6 +10,7 @@ class EventLogger:
 
     def __init__(self):
         self.logs: List[Dict] = []
+        self.action_counts: Dict[str, int] = {}
 
     def log(self, from_agent: str, to_agent: str, action: str, message: str):
         """Log a communication event"""
@@ -18,9 +21,10 @@ class EventLogger:
             'action': action,
             'message': message
         })
+        self.action_counts[action] = self.action_counts.get(action, 0) + 1
 
         # Print to console
-        print(f"[{from_agent} → {to_agent}] {action}: {message}")
+        sys.stdout.write(f"[{from_agent} → {to_agent}] {action}: {message}\n")
 
     def get_logs(self) -> List[Dict]:
         """Get all logs"""
@@ -28,15 +32,14 @@ class EventLogger:
 
     def print_summary(self):
         """Print formatted summary"""
-        enrichments = [l for l in self.logs if l['action'] == 'DATA_ENRICHMENT']
-        resolutions = [l for l in self.logs if l['action'] == 'QUALITY_RESOLUTION']
-
-        print(f"  • Data Enrichments: {len(enrichments)}")
-        print(f"  • Quality Resolutions: {len(resolutions)}")
+        enrichments = self.action_counts.get('DATA_ENRICHMENT', 0)
+        print(f"  • Data Enrichments: {enrichments}")
+        print(f"  • Quality Resolutions: {self.action_counts.get('QUALITY_RESOLUTION', 0)}")
 
         if enrichments:
             print("\n  Examples:")
-            for log in enrichments[:3]:
+            examples = (l for l in self.logs if l['action'] == 'DATA_ENRICHMENT')
+            for log in islice(examples, 3):
                 print(f"    - {log['message']}")
 
 # Global event logger
@@ -0,0 +1,56 @@
+"""JSON encode/decode helpers; uses orjson when installed, stdlib json otherwise"""
+
+import json
+import os
+import tempfile
+from datetime import date, datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def loads(data):
+    """Parse JSON from str or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _default(obj):
+    # orjson writes datetimes natively as ISO 8601; match that in the fallback
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 bytes; indent=True gives 2-space pretty output"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_default).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=_default).encode('utf-8')
+
+
+def load_file(path: str):
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dump_file(path: str, obj, indent: bool = False):
+    """Write atomically: readers see the old file or the new one, never a partial write"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix='.tmp_', suffix='.json')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(dumps(obj, indent=indent))
+        # mkstemp creates 0600; keep the replaced file's mode, or use the usual 0644 for a new one
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -1,14 +1,20 @@
-import json
 import os
 import sys
 from datetime import datetime
 from typing import Optional
 from threading import Lock
 
+from utils import json_io
+
 class LiveLogger:
     def __init__(self):
         self.logs = []
+        self._last_by_agent = {}
+        self._count_by_agent = {}
+        self._count_by_level = {}
+        self._formatted = []
         self.lock = Lock()
+        self.generation = 0
         self.session_start = datetime.now()
         self.cancelled = False
         self.completed = False
@@ -17,36 +23,71 @@ class LiveLogger:
         self.pipeline_running = False
 
     def log(self, level: str, agent: str, action: str, details: str = "", metadata: dict = None):
+        entry = self._entry(level, agent, action, details, metadata)
+        with self.lock:
+            self._append(entry)
+        # Callers flush their own console prints; only errors force pending output out here
+        if level == "ERROR":
+            sys.stdout.flush()
+
+    @staticmethod
+    def _entry(level: str, agent: str, action: str, details: str = "", metadata: dict = None) -> dict:
+        return {
+            "timestamp": datetime.now(),
+            # A handful of distinct values repeated across every entry; share one object each
+            "level": sys.intern(level),
+            "agent": sys.intern(agent),
+            "action": sys.intern(action),
+            "details": details,
+            "metadata": metadata or {}
+        }
+
+    def _append(self, entry: dict):
+        """Store an entry and update the running indexes; caller holds the lock"""
+        self.logs.append(entry)
+        agent, level = entry["agent"], entry["level"]
+        self._last_by_agent[agent] = entry
+        self._count_by_agent[agent] = self._count_by_agent.get(agent, 0) + 1
+        self._count_by_level[level] = self._count_by_level.get(level, 0) + 1
+
+    def get_last(self, agent: str):
+        with self.lock:
+            return self._last_by_agent.get(agent)
+
+    def get_count(self, agent: str) -> int:
         with self.lock:
-            self.logs.append({
-                "timestamp": datetime.now().isoformat(),
-                "level": level,
-                "agent": agent,
-                "action": action,
-                "details": details,
-                "metadata": metadata or {}
-            })
-        sys.stdout.flush()
+            return self._count_by_agent.get(agent, 0)
 
     def get_logs(self, agent: Optional[str] = None, level: Optional[str] = None):
+        # Filter in one pass under the lock instead of copying everything first
         with self.lock:
-            logs = self.logs.copy()
-        if agent:
-            logs = [l for l in logs if l["agent"] == agent]
-        if level:
-            logs = [l for l in logs if l["level"] == level]
-        return logs
+            if not agent and not level:
+                return self.logs.copy()
+            return [l for l in self.logs
+                    if (not agent or l["agent"] == agent) and (not level or l["level"] == level)]
+
+    def get_logs_since(self, generation: int, cursor: int):
+        """Returns (generation, entries); a cursor from an older generation restarts at 0"""
+        with self.lock:
+            if generation != self.generation:
+                cursor = 0
+            return self.generation, self.logs[cursor:]
+
+    @staticmethod
+    def _format_entry(log: dict) -> str:
+        ts = log["timestamp"].strftime("%H:%M:%S")
+        line = f"[{ts}] [{log['agent'].upper()}] {log['action']}"
+        if log["details"]:
+            line += f": {log['details']}"
+        return line
 
     def get_formatted_logs(self, agent: Optional[str] = None):
-        logs = self.get_logs(agent=agent)
-        lines = []
-        for log in logs:
-            ts = datetime.fromisoformat(log["timestamp"]).strftime("%H:%M:%S")
-            line = f"[{ts}] [{log['agent'].upper()}] {log['action']}"
-            if log["details"]:
-                line += f": {log['details']}"
-            lines.append(line)
-        return "\n".join(lines)
+        if agent:
+            return "\n".join(self._format_entry(log) for log in self.get_logs(agent=agent))
+        # Unfiltered output is built incrementally: only entries added since the last call are formatted
+        with self.lock:
+            self._formatted.extend(self._format_entry(log) for log in self.logs[len(self._formatted):])
+            return "\n".join(self._formatted)
 
     def save_to_file(self, filepath: str = None):
         if filepath is None:
@@ -56,27 +97,35 @@ class LiveLogger:
 
         with self.lock:
             json_path = filepath.replace(".log", ".json")
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump({
-                    "session_start": self.session_start.isoformat(),
-                    "session_end": datetime.now().isoformat(),
-                    "total_logs": len(self.logs),
-                    "logs": self.logs
-                }, f, indent=2)
-
+            json_io.dump_file(json_path, {
+                "session_start": self.session_start,
+                "session_end": datetime.now(),
+                "total_logs": len(self.logs),
+                "logs": self.logs
+            }, indent=True)
+
+            parts = [
+                "=== Session Log ===\n",
+                f"Start: {self.session_start.isoformat()}\n",
+                f"End: {datetime.now().isoformat()}\n\n",
+            ]
+            parts.extend(
+                f"[{log['timestamp']:%Y-%m-%d %H:%M:%S}] [{log['level']}] [{log['agent']}] {log['action']}: {log['details']}\n"
+                for log in self.logs
+            )
             with open(filepath, "w", encoding="utf-8") as f:
-                f.write(f"=== Session Log ===\n")
-                f.write(f"Start: {self.session_start.isoformat()}\n")
-                f.write(f"End: {datetime.now().isoformat()}\n\n")
-                for log in self.logs:
-                    ts = datetime.fromisoformat(log["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
-                    f.write(f"[{ts}] [{log['level']}] [{log['agent']}] {log['action']}: {log['details']}\n")
+                f.write("".join(parts))
 
         return filepath, json_path
 
     def clear(self):
         with self.lock:
             self.logs.clear()
+            self._last_by_agent.clear()
+            self._count_by_agent.clear()
+            self._count_by_level.clear()
+            self._formatted.clear()
+            self.generation += 1
             self.session_start = datetime.now()
             self.cancelled = False
             self.completed = False
@@ -99,14 +148,7 @@ class LiveLogger:
         with self.lock:
             self.cancelled = True
             self.pipeline_running = False
-            self.logs.append({
-                "timestamp": datetime.now().isoformat(),
-                "level": "INFO",
-                "agent": "system",
-                "action": "CANCELLED",
-                "details": "User requested cancellation",
-                "metadata": {}
-            })
+            self._append(self._entry("INFO", "system", "CANCELLED", "User requested cancellation"))
 
     def is_cancelled(self):
         with self.lock:
@@ -119,23 +161,9 @@ class LiveLogger:
             self.result = result
             self.error = error
             if error:
-                self.logs.append({
-                    "timestamp": datetime.now().isoformat(),
-                    "level": "ERROR",
-                    "agent": "system",
-                    "action": "PIPELINE_ERROR",
-                    "details": str(error),
-                    "metadata": {}
-                })
+                self._append(self._entry("ERROR", "system", "PIPELINE_ERROR", str(error)))
             else:
-                self.logs.append({
-                    "timestamp": datetime.now().isoformat(),
-                    "level": "INFO",
-                    "agent": "system",
-                    "action": "PIPELINE_COMPLETE",
-                    "details": "Pipeline finished successfully",
-                    "metadata": {}
-                })
+                self._append(self._entry("INFO", "system", "PIPELINE_COMPLETE", "Pipeline finished successfully"))
 
     def is_completed(self):
         with self.lock:
@@ -153,11 +181,14 @@ class LiveLogger:
         with self.lock:
             return {
                 "total_events": len(self.logs),
-                "api_calls": len([l for l in self.logs if l["level"] == "API_CALL"]),
-                "agent1_actions": len([l for l in self.logs if l["agent"] == "agent1"]),
-                "agent2_actions": len([l for l in self.logs if l["agent"] == "agent2"]),
-                "errors": len([l for l in self.logs if l["level"] == "ERROR"]),
+                "api_calls": self._count_by_level.get("API_CALL", 0),
+                "agent1_actions": self._count_by_agent.get("agent1", 0),
+                "agent2_actions": self._count_by_agent.get("agent2", 0),
+                "errors": self._count_by_level.get("ERROR", 0),
                 "duration": (datetime.now() - self.session_start).total_seconds()
             }
 
 live_logger = LiveLogger()
+
+def get_live_logger() -> LiveLogger:
+    return live_logger
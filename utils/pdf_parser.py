@@ -29,39 +29,68 @@ Backwards compatibility
 
 from __future__ import annotations
 
-import builtins
+import functools
 import os
 import re
-from collections import Counter
-from typing import Dict, List, Tuple
+import string
+from typing import Dict, Iterator, List, Tuple
 
 import fitz  # PyMuPDF
 
 
+# Patterns are applied per line, so compile them once here
+_NEW_TAG_RE = re.compile(r"\s+\bNEW\b\s*$", re.IGNORECASE)
+_AMPERSAND_RE = re.compile(r"\s*&\s*")
+_WHITESPACE_RE = re.compile(r"\s+")
+_NUMBER_RE = re.compile(r"\d+(\.\d+)?%?")
+# Conference chrome phrases and bare page numbers, checked in one scan per line
+_HEADER_FOOTER_RE = re.compile(
+    r"fieldserviceusa\.wbresearch\.com|register now|jump to|request a quote|\A\d+\Z"
+)
+_TEAM_RE = re.compile(r"^(.*?)\s*\(Team of\s*(\d+)\)\s*$", re.IGNORECASE)
+# Marketing lines on attendee pages and chrome inside speaker cards (lowercased text)
+_ATTENDEE_SKIP_RE = re.compile(r"sponsorship|speaking|exhibition|now open")
+_SPEAKER_CARD_SKIP_RE = re.compile(r"fieldserviceusa\.wbresearch\.com|register now|jump to|about")
+
+# A name word is an ASCII capital followed by letters, apostrophes, hyphens or dots
+_NAME_INITIALS = frozenset(string.ascii_uppercase)
+_NAME_CHARS = frozenset(string.ascii_letters + "'-.")
+# Words that never appear in a speaker's name
+_NON_NAME_WORDS = frozenset({
+    "agenda", "speaker", "lineup", "register", "now", "about", "jump", "to",
+    "day", "am", "pm",
+})
+
+
 # -----------------------------
 # Normalization helpers
 # -----------------------------
 def _norm(text: str) -> str:
-    return " ".join((text or "").replace("\u00a0", " ").replace("\t", " ").split())
+    # str.split() already treats NBSP, tabs and newlines as whitespace
+    return " ".join((text or "").split())
 
 
 def _strip_new_tag(text: str) -> str:
     """Remove trailing NEW tag used in the agenda speaker lineup."""
     text = _norm(text)
-    return re.sub(r"\s+\bNEW\b\s*$", "", text, flags=re.IGNORECASE).strip()
+    return _NEW_TAG_RE.sub("", text).strip()
 
 
+@functools.lru_cache(maxsize=8192)
 def clean_company_name(name: str) -> str:
     """Light normalization; keep internal punctuation (e.g., ASML/Cymer)."""
     name = _strip_new_tag(name).strip(" ,")
-    name = re.sub(r"\s*&\s*", " & ", name)
-    name = re.sub(r"\s+", " ", name).strip()
+    name = _AMPERSAND_RE.sub(" & ", name)
+    name = _WHITESPACE_RE.sub(" ", name).strip()
     return name
 
 
 # -----------------------------
 # Validators / filters
 # -----------------------------
+# The predicates below are pure and headers/footers repeat on every page, so
+# their verdicts are memoized per distinct line.
+@functools.lru_cache(maxsize=4096)
 def is_person_name(text: str) -> bool:
     """Heuristic: 2–4 capitalized tokens, no commas/digits."""
     text = _norm(text)
@@ -69,21 +98,18 @@ def is_person_name(text: str) -> bool:
         return False
     if "," in text:
         return False
-    if re.search(r"\d", text):
-        return False
 
     words = text.split()
     if len(words) < 2 or len(words) > 4:
         return False
 
-    bad = {
-        "agenda", "speaker", "lineup", "register", "now", "about", "jump", "to",
-        "day", "am", "pm",
-    }
-    if builtins.any(w.lower() in bad for w in words):
-        return False
-
-    return builtins.all(re.match(r"^[A-Z][A-Za-z'\-\.]*$", w) for w in words)
+    # Single pass over the words; the name character set also rules out digits
+    for w in words:
+        if w[0] not in _NAME_INITIALS or not _NAME_CHARS.issuperset(w):
+            return False
+        if w.lower() in _NON_NAME_WORDS:
+            return False
+    return True
 
 
 def is_valid_company_name(text: str) -> bool:
@@ -91,39 +117,48 @@ def is_valid_company_name(text: str) -> bool:
     t = clean_company_name(text)
     if not t or len(t) < 2 or len(t) > 90:
         return False
-    if re.fullmatch(r"\d+(\.\d+)?%?", t):
+    if _NUMBER_RE.fullmatch(t):
         return False
     return True
 
 
+@functools.lru_cache(maxsize=4096)
 def is_header_footer(text: str) -> bool:
     """Filter obvious conference chrome / marketing lines."""
     t = _norm(text).lower()
-    if not t:
-        return True
-    if "fieldserviceusa.wbresearch.com" in t:
-        return True
-    if "register now" in t or "jump to" in t:
+    if not t or len(t) > 140:
         return True
     if "sponsorship" in t and "now open" in t:
         return True
-    if "request a quote" in t:
-        return True
-    if len(t) > 140:
-        return True
-    if re.fullmatch(r"\d+", t):
-        return True
-    return False
+    return _HEADER_FOOTER_RE.search(t) is not None
 
 
 # -----------------------------
 # PyMuPDF layout helpers
 # -----------------------------
 def _dominant_font(line: Dict) -> str:
-    fonts = [s.get("font", "") for s in line.get("spans", []) if (s.get("text") or "").strip()]
-    if not fonts:
-        return ""
-    return Counter(fonts).most_common(1)[0][0]
+    spans = line.get("spans", ())
+
+    # Most lines are set in a single font; only count when a second one shows up
+    first = None
+    for s in spans:
+        if not (s.get("text") or "").strip():
+            continue
+        font = s.get("font", "")
+        if first is None:
+            first = font
+        elif font != first:
+            break
+    else:
+        return first or ""
+
+    counts: Dict[str, int] = {}
+    for s in spans:
+        if (s.get("text") or "").strip():
+            font = s.get("font", "")
+            counts[font] = counts.get(font, 0) + 1
+    # max() keeps the first font seen on ties, as Counter.most_common did
+    return max(counts, key=counts.__getitem__)
 
 
 def _line_text(line: Dict) -> str:
@@ -136,6 +171,25 @@ def _is_company_font(font: str) -> bool:
     return ("bold" in f) and ("light" not in f)
 
 
+@functools.lru_cache(maxsize=16)
+def _read_page_texts(pdf_path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    doc = fitz.open(pdf_path)
+    try:
+        return tuple(page.get_text() for page in doc)
+    finally:
+        doc.close()
+
+
+def _page_texts(pdf_path: str) -> Tuple[str, ...]:
+    """Plain text of every page, extracted once per file version.
+
+    The agenda is parsed twice (speaker lineup + schedule lines), so both passes
+    share one extraction; the (mtime, size) key picks up a replaced file.
+    """
+    st = os.stat(pdf_path)
+    return _read_page_texts(pdf_path, st.st_mtime_ns, st.st_size)
+
+
 def _dedupe_records(rows: List[Dict]) -> List[Dict]:
     """Deduplicate *records* by (company, contact, title, role)."""
     seen = set()
@@ -164,16 +218,16 @@ def parse_attendee_list_pdf(pdf_path: str) -> List[Dict]:
     results: List[Dict] = []
 
     for page_index in range(doc.page_count):
-        page = doc[page_index]
-        page_text = page.get_text()
-        team_cnt = page_text.lower().count("team of")
-        blocks = page.get_text("blocks")
+        # Block texts cover the same lines as page.get_text(), so one extraction serves both
+        blocks = doc[page_index].get_text("blocks")
+        team_cnt = sum(b[4].lower().count("team of") for b in blocks)
 
         # In the provided attendee PDF, the real company list pages match this signature.
         if team_cnt < 5 and len(blocks) < 40:
             continue
 
-        for _, _, _, _, block_text, *_ in blocks:
+        for block in blocks:
+            block_text = block[4]
             if len(block_text) > 200:
                 continue
 
@@ -182,11 +236,10 @@ def parse_attendee_list_pdf(pdf_path: str) -> List[Dict]:
                 if not line or is_header_footer(line):
                     continue
 
-                low = line.lower()
-                if builtins.any(k in low for k in ["sponsorship", "speaking", "exhibition", "now open"]):
+                if _ATTENDEE_SKIP_RE.search(line.lower()):
                     continue
 
-                m = re.match(r"^(.*?)\s*\(Team of\s*(\d+)\)\s*$", line, flags=re.IGNORECASE)
+                m = _TEAM_RE.match(line)
                 if m:
                     company = clean_company_name(m.group(1))
                     team_size = int(m.group(2))
@@ -196,10 +249,10 @@ def parse_attendee_list_pdf(pdf_path: str) -> List[Dict]:
                     team_size = 1
                     confidence = 0.90
 
-                if re.fullmatch(r"\d+(\.\d+)?%?", company):
-                    continue
                 if len(company) < 2 or len(company) > 80:
                     continue
+                if _NUMBER_RE.fullmatch(company):
+                    continue
 
                 results.append(
                     {
@@ -221,17 +274,16 @@ def parse_attendee_list_pdf(pdf_path: str) -> List[Dict]:
 
 def parse_agenda_speaker_lineup_pdf(pdf_path: str) -> List[Dict]:
     """Extract speaker cards from agenda speaker lineup pages (font-aware)."""
+    page_texts = _page_texts(pdf_path)
     doc = fitz.open(pdf_path)
     pdf_filename = os.path.basename(pdf_path)
     results: List[Dict] = []
 
-    for page_index in range(doc.page_count):
-        page = doc[page_index]
-        page_text = page.get_text()
+    for page_index, page_text in enumerate(page_texts):
         if "SPEAKER LINEUP" not in page_text and "VOICES OF THE NEXT ERA" not in page_text:
             continue
 
-        page_dict = page.get_text("dict")
+        page_dict = doc[page_index].get_text("dict")
         for block in page_dict.get("blocks", []):
             if block.get("type") != 0:
                 continue
@@ -251,7 +303,7 @@ def parse_agenda_speaker_lineup_pdf(pdf_path: str) -> List[Dict]:
                 continue
 
             combined = " ".join(t for t, _ in line_items).lower()
-            if builtins.any(k in combined for k in ["fieldserviceusa.wbresearch.com", "register now", "jump to", "about"]):
+            if _SPEAKER_CARD_SKIP_RE.search(combined):
                 continue
 
             name = line_items[0][0]
@@ -266,11 +318,14 @@ def parse_agenda_speaker_lineup_pdf(pdf_path: str) -> List[Dict]:
                     j -= 1
                     continue
                 if _is_company_font(font):
-                    company_parts.insert(0, _strip_new_tag(t))
+                    company_parts.append(_strip_new_tag(t))
                     j -= 1
                 else:
                     break
 
+            # Collected bottom-up; restore reading order
+            company_parts.reverse()
+
             if not company_parts:
                 company_parts = [_strip_new_tag(line_items[-1][0])]
                 j = len(line_items) - 2
@@ -300,14 +355,10 @@ def parse_agenda_speaker_lineup_pdf(pdf_path: str) -> List[Dict]:
 
 def parse_agenda_schedule_lines(pdf_path: str) -> List[Dict]:
     """Secondary extraction: schedule pages sometimes list 'Name, Title, Company'."""
-    doc = fitz.open(pdf_path)
     pdf_filename = os.path.basename(pdf_path)
     results: List[Dict] = []
 
-    for page_index in range(doc.page_count):
-        page = doc[page_index]
-        text = page.get_text()
-
+    for page_index, text in enumerate(_page_texts(pdf_path)):
         if "AGENDA" not in text and "Day" not in text and " AM" not in text and " PM" not in text:
             continue
 
@@ -315,17 +366,15 @@ def parse_agenda_schedule_lines(pdf_path: str) -> List[Dict]:
             line = _norm(raw)
             if not line or is_header_footer(line):
                 continue
-            if line.count(",") < 2:
+            # 'Name, Title, Company': split at the first and last comma (needs two)
+            name, _, rest = line.partition(",")
+            title, sep, company = rest.rpartition(",")
+            if not sep:
                 continue
 
-            first = line.find(",")
-            last = line.rfind(",")
-            if last == first:
-                continue
-
-            name = _norm(line[:first])
-            company = clean_company_name(line[last + 1 :])
-            title = _norm(line[first + 1 : last])
+            name = _norm(name)
+            company = clean_company_name(company)
+            title = _norm(title)
 
             if not is_person_name(name):
                 continue
@@ -346,7 +395,6 @@ def parse_agenda_schedule_lines(pdf_path: str) -> List[Dict]:
                 }
             )
 
-    doc.close()
     return _dedupe_records(results)
 
 
@@ -377,22 +425,33 @@ def parse_generic_pdf(pdf_path: str) -> List[Dict]:
 # Fallback parser (minimal)
 # -----------------------------
 def extract_text_from_pdf(pdf_path: str) -> str:
+    return "\n".join(_page_texts(pdf_path))
+
+
+def _iter_lines(pdf_path: str) -> Iterator[str]:
+    """Stripped, non-empty lines, extracting one page at a time.
+
+    Deliberately bypasses the _page_texts cache so only the current page's text is held.
+    """
     doc = fitz.open(pdf_path)
-    parts = [p.get_text() for p in doc]
-    doc.close()
-    return "\n".join(parts)
+    try:
+        for page in doc:
+            for raw in page.get_text().splitlines():
+                line = raw.strip()
+                if line:
+                    yield line
+    finally:
+        doc.close()
 
 
 def parse_text_fallback(pdf_path: str) -> List[Dict]:
-    text = extract_text_from_pdf(pdf_path)
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
     pdf_filename = os.path.basename(pdf_path)
     results: List[Dict] = []
 
-    for ln in lines:
+    for ln in _iter_lines(pdf_path):
         if is_header_footer(ln):
             continue
-        m = re.match(r"^(.*?)\s*\(Team of\s*(\d+)\)\s*$", ln, flags=re.IGNORECASE)
+        m = _TEAM_RE.match(ln)
         if m:
             results.append(
                 {
@@ -421,20 +480,17 @@ def deduplicate_companies(companies: List[Dict]) -> List[Dict]:
         if not key:
             continue
 
-        if key not in seen:
+        existing = seen.get(key)
+        if existing is None:
             seen[key] = c
             continue
 
-        existing = seen[key]
         existing["confidence"] = max(existing.get("confidence", 0), c.get("confidence", 0))
 
         if c.get("team_size"):
             existing["team_size"] = max(existing.get("team_size") or 0, c.get("team_size") or 0) or existing.get("team_size")
 
-        ex_flags = set(existing.get("flags", []))
-        for fl in c.get("flags", []):
-            ex_flags.add(fl)
-        existing["flags"] = sorted(ex_flags)
+        existing["flags"] = sorted(set(existing.get("flags", [])).union(c.get("flags", [])))
 
     return list(seen.values())
 
@@ -442,6 +498,7 @@ def deduplicate_companies(companies: List[Dict]) -> List[Dict]:
 def merge_all_companies(all_companies: List[Dict]) -> List[Dict]:
     """Merge across PDFs; preserve *multiple* contacts per company."""
     merged: Dict[str, Dict] = {}
+    contact_keys: Dict[str, set] = {}  # company key -> {(name, title)} lowercased
 
     for c in all_companies:
         company = clean_company_name(c.get("company") or "")
@@ -459,6 +516,7 @@ def merge_all_companies(all_companies: List[Dict]) -> List[Dict]:
                 "flags": set(c.get("flags", [])),
                 "contacts": [],  # list[{name,title,source_pdf}]
             }
+            contact_keys[key] = set()
 
         m = merged[key]
         if c.get("source_pdf"):
@@ -480,17 +538,15 @@ def merge_all_companies(all_companies: List[Dict]) -> List[Dict]:
                 "title": _norm(c.get("contact_title") or "") or None,
                 "source_pdf": c.get("source_pdf"),
             }
-            if not builtins.any(
-                (ct.get("name", "").lower() == contact["name"].lower())
-                and ((ct.get("title") or "").lower() == (contact.get("title") or "").lower())
-                for ct in m["contacts"]
-            ):
+            contact_key = (contact["name"].lower(), (contact["title"] or "").lower())
+            if contact_key not in contact_keys[key]:
+                contact_keys[key].add(contact_key)
                 m["contacts"].append(contact)
 
     out: List[Dict] = []
     for m in merged.values():
         m["source_pdf"] = ", ".join(sorted(m["source_pdfs"]))
-        m["role"] = ", ".join(sorted(set(m["roles"])))
+        m["role"] = ", ".join(sorted(m["roles"]))
         m["flags"] = sorted(m["flags"])
         del m["source_pdfs"]
         del m["roles"]